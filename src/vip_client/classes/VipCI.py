@@ -1,8 +1,13 @@
 # Builtins
 from __future__ import annotations
+import json
 import os
 import time
+import uuid
+from contextlib import ExitStack
 from pathlib import *
+# Third-Party
+import requests
 # Try importing the Girder client
 try:
     import girder_client
@@ -51,13 +56,25 @@ class VipCI(VipLauncher):
     # Default backup location 
     # (set to None to avoid saving and loading backup files)
     _BACKUP_LOCATION = "girder"
+    # Maximum number of parallel requests to Girder
+    _MAX_THREADS = 16
 
     # --- New Attributes ---
 
     # Prefix that defines a Girder ID
     _GIRDER_ID_PREFIX = "pilotGirder"
+    # Prefix of the Girder IDs sent to VIP (i.e., in format "[_GIRDER_ID_PREFIX]:[girder_id]")
+    _VIP_GIRDER_ID_PREFIX = _GIRDER_ID_PREFIX + ":"
     # Grider portal
     _GIRDER_PORTAL = 'https://pilot-warehouse.creatis.insa-lyon.fr/api/v1'
+    # Girder IDs and types of the resources already found, by path (will evolve after each lookup)
+    _GIRDER_IDS = {}
+    # Girder paths of the resources already found, by ID (will evolve after each lookup)
+    _GIRDER_PATHS = {}
+    # Number of ancestors checked one by one in `_mkdirs()` before checking the others in parallel
+    _MKDIRS_WALK = 3
+    # Context holding the HTTP session of the Girder client (closed by the next call to `init()`)
+    _GIRDER_SESSION = None
 
                     #################
     ################ Main Properties ##################
@@ -73,6 +90,16 @@ class VipCI(VipLauncher):
             assert isinstance(value, dict), f"Custom metadata must be a dictionary, not {type(value)}"
         self._custom_wf_metadata = value
 
+    # Girder ID of the output directory (read-only)
+    @property
+    def _vip_output_dir_id(self) -> str:
+        """
+        Girder ID of `vip_output_dir`. 
+        The lookup is made once per output directory (see `_girder_path_to_id()`).
+        Raises `girder_client.HttpError` if the directory does not exist.
+        """
+        folderId, _ = self._girder_path_to_id(self._vip_output_dir)
+        return folderId
 
 
                     #############
@@ -112,6 +139,8 @@ class VipCI(VipLauncher):
         `session_name` is only set at instantiation; other properties can be set later in function calls.
         If `output_dir` leads to data from a previous session, properties will be loaded from the metadata on Girder.
         """
+        # Metadata last written by this instance, by Girder folder ID and key (in JSON format)
+        self._saved_metadata = {}
         # Initialize with the name, pipeline and input settings
         super().__init__(
             output_dir = output_dir,
@@ -145,9 +174,10 @@ class VipCI(VipLauncher):
         ## Parameters
         - `vip_key` (str): VIP API key. This can be either:
             A. [unsafe] A **string litteral** containing your API key,
-            B. [safer] A **path to some local file** containing your API key,
-            C. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY").
-        In cases B or C, the API key will be loaded from the local file or the environment variable. 
+            B. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY"),
+            C. [safer] A **path to some local file** containing your API key.
+        In cases B or C, the API key will be loaded from the environment variable or the local file. 
+        If `vip_key` is both the name of an environment variable and a path to a local file, the environment variable is used.
 
         - `girder_key` (str): Girder API key. Can take the same values as `vip_key`.
         
@@ -161,9 +191,18 @@ class VipCI(VipLauncher):
         super().init(api_key=vip_key, verbose=False)
         # Restore the verbose state
         cls._VERBOSE = verbose
+        # Close the HTTP session of the previous Girder client
+        if cls._GIRDER_SESSION is not None:
+            cls._GIRDER_SESSION.close()
         # Instantiate a Girder client
         cls._girder_client = girder_client.GirderClient(apiUrl=cls._GIRDER_PORTAL)
-        # Check if `girder_key` is in a local file or environment variable
+        # Keep HTTP connections alive between requests to Girder (until the next call to `init()`)
+        cls._GIRDER_SESSION = ExitStack()
+        cls._GIRDER_SESSION.enter_context(cls._girder_client.session(session=cls._new_girder_session()))
+        # Forget the resources found with previous credentials
+        cls._GIRDER_IDS.clear()
+        cls._GIRDER_PATHS.clear()
+        # Check if `girder_key` is in an environment variable or local file
         true_key = cls._get_api_key(girder_key)
         # Authenticate with Girder API key
         cls._girder_client.authenticate(apiKey=true_key)
@@ -212,7 +251,7 @@ class VipCI(VipLauncher):
     def monitor_workflows(self, refresh_time=30) -> VipCI:
         """
         Updates and displays the status of each execution launched in the current session.
-        - If an execution is still runnig, updates status every `refresh_time` (seconds) until all runs are done.
+        - If an execution is still runnig, updates status until all runs are done, waiting up to `refresh_time` (seconds) between updates.
         - Displays a full report when all executions are done.
         """
         return super().monitor_workflows(refresh_time=refresh_time)
@@ -280,14 +319,24 @@ class VipCI(VipLauncher):
     def _exists(cls, path: PurePath, location="girder") -> bool:
         """
         Checks existence of a resource on Girder.
+        Resources already found (see `_girder_path_to_id()`) are not looked up again:
+        input files are refreshed before their check (see `_check_input_files()`).
         """
         # Check path existence in `location`
         if location=="girder":
-            try: 
-                cls._girder_client.resourceLookup(path=str(path))
+            if str(path) in cls._GIRDER_IDS:
                 return True
+            # With `test=True`, Girder returns null instead of an error if the resource is missing
+            try: 
+                resource = cls._girder_client.get("resource/lookup", parameters={"path": str(path), "test": True})
             except girder_client.HttpError: 
                 return False
+            if not resource:
+                return False
+            # Record the resource for the next lookups
+            if "_modelType" in resource:
+                cls._GIRDER_IDS[str(path)] = resource["_id"], resource["_modelType"]
+            return True
         else: 
             raise NotImplementedError(f"Unknown location: {location}")
     # ------------------------------------------------
@@ -298,24 +347,73 @@ class VipCI(VipLauncher):
         """
         Creates a directory at `path` on Girder if `location` is "girder".
 
-        `path` should be a PathLib object.
+        `path` can be a string or PathLib object.
         `kwargs` can be passed as keyword arguments to `girder-client.createFolder()`.
         Returns the Girder ID of the newly created folder.
         """
         if location == "girder": 
+            # Split the parent path and the folder name
+            parent, _, name = str(path).rpartition("/")
             # Find the parent ID and type
-            parentId, parentType = cls._girder_path_to_id(str(path.parent))
+            parentId, parentType = cls._girder_path_to_id(parent)
             # Check the parent is a directory
             if not (parentType == "folder"):
-                raise ValueError(f"Cannot create folder {path} in '{path.parent}': parent is not a Girder folder")
+                raise ValueError(f"Cannot create folder {path} in '{parent}': parent is not a Girder folder")
             # Create the new directory with additional keyword arguments
-            return cls._girder_client.createFolder(
-                parentId=parentId, name=str(path.name), reuseExisting=True, **kwargs
-                )["_id"]
+            folderId = cls._with_girder_ids([parent], lambda ids: cls._girder_client.createFolder(
+                parentId=ids[0], name=name, reuseExisting=True, **kwargs
+                )["_id"])
+            # Record the new directory for the next lookups
+            cls._invalidate_path_cache(path)
+            cls._GIRDER_IDS[str(path)] = folderId, "folder"
+            return folderId
         else: 
             raise NotImplementedError(f"Unknown location: {location}")
     # ------------------------------------------------
 
+    # Method to create a directory leaf on the top of any path
+    @classmethod
+    def _mkdirs(cls, path: PurePath, location="girder", **kwargs) -> str:
+        """
+        Creates each non-existent directory in `path` (like os.mkdirs()).
+        Returns the newly created part of `path` (empty string if `path` already exists).
+
+        Returns immediately if `path` is a Girder resource that was already found.
+        Otherwise, the ancestors of `path` are checked from the leaf up to the first existing one.
+        After `_MKDIRS_WALK` checks, the remaining ancestors are checked with parallel requests.
+        """
+        if location != "girder":
+            return super()._mkdirs(path=path, location=location, **kwargs)
+        # Case : the current path exists
+        path = PurePosixPath(path)
+        if cls._exists(path=path, location=location):
+            return ""
+        # Ancestors within the collection (i.e., below "/collection/[collection_name]")
+        ancestors = [parent for parent in path.parents if len(parent.parts) > 3]
+        # Find the deepest existing ancestor, walking up from the leaf
+        existing = next(
+            (parent for parent in ancestors[:cls._MKDIRS_WALK] if cls._exists(path=parent, location=location)), 
+            None
+        )
+        # Long walk: check the other ancestors in parallel
+        if existing is None and len(ancestors) > cls._MKDIRS_WALK:
+            ancestors = ancestors[cls._MKDIRS_WALK:]
+            found = cls._map_parallel(
+                lambda parent: cls._exists(path=parent, location=location), ancestors, vip_sessions=False
+            )
+            existing = next((parent for parent, exists in zip(ancestors, found) if exists), None)
+        # Let the parent method handle the error if no ancestor exists
+        if existing is None:
+            return super()._mkdirs(path=path, location=location, **kwargs)
+        # Create the other nodes one by one
+        dir_to_make = existing
+        for part in path.relative_to(existing).parts:
+            dir_to_make /= part
+            cls._create_dir(path=dir_to_make, location=location, **kwargs)
+        # Return the created nodes
+        return str(path.relative_to(existing))
+    # ------------------------------------------------
+
     # Function to delete a path
     @classmethod
     def _delete_path(cls, path: PurePath, location="vip") -> None:
@@ -338,11 +436,13 @@ class VipCI(VipLauncher):
         # Get function arguments
         # input_settings = self._vip_input_settings(self._input_settings)
         input_settings = self._get_input_settings(location="vip-girder")
-        # Create a workflow-specific result directory
-        res_path = self._vip_output_dir / time.strftime('%Y-%m-%d_%H:%M:%S', time.localtime()) 
-            # no simple way to rename later with workflow_id
+        # Create a workflow-specific result directory (with a unique name for parallel launches)
+        res_name = "_".join([
+            time.strftime('%Y-%m-%d_%H%M%S', time.localtime()), uuid.uuid4().hex[:8]
+        ]) # no simple way to rename later with workflow_id
+        res_path = f"{self._vip_output_dir}/{res_name}"
         res_id = self._create_dir(
-            path=res_path, location="girder", 
+            path=res_path, location="girder",
             description=f"VIP outputs from one workflow in Session '{self._session_name}'"
         )
         res_vip = self._vip_girder_id(res_id)
@@ -354,21 +454,22 @@ class VipCI(VipLauncher):
             resultsLocation = res_vip
         )
         # Record the path to output files (create the workflow entry)
-        self._workflows[workflow_id] = {"output_path": str(res_path)}
+        self._workflows[workflow_id] = {"output_path": res_path}
         return workflow_id
     # ------------------------------------------------
 
     # Function extract metadata from a single workflow
     def _meta_workflow(self, workflow_id: str) -> dict:
+        workflow = self._workflows[workflow_id]
         metadata = {
             "session_name": self._session_name,
             "workflow_id": workflow_id,
-            "workflow_start": self._workflows[workflow_id]["start"],
-            "workflow_status": self._workflows[workflow_id]["status"]
+            "workflow_start": workflow["start"],
+            "workflow_status": workflow["status"]
         }
         # If custom metadata is provided, add it to the metadata
         if self.custom_wf_metadata is not None:
-            metadata = {**metadata, **self.custom_wf_metadata}
+            metadata.update(self.custom_wf_metadata)
         return metadata
 
     # Overwrite _get_exec_infos() to bypass call to vip.get_exec_results() (does not work at this time)
@@ -416,14 +517,29 @@ class VipCI(VipLauncher):
             return NotImplementedError(f"Location '{location}' is unknown for {self.__name__}")
         # Ensure the output directory exists on Girder
         is_new = self._mkdirs(path=self._vip_output_dir, location=location)
-        # Save metadata in the global output directory
-        folderId, _ = self._girder_path_to_id(self._vip_output_dir)
-        self._girder_client.addMetadataToFolder(folderId=folderId, metadata=session_data)
-        # Update metadata for each workflow
-        for workflow_id in self._workflows:
-            metadata = self._meta_workflow(workflow_id=workflow_id)
-            folderId, _ = self._girder_path_to_id(path=self._workflows[workflow_id]["output_path"])
-            self._girder_client.addMetadataToFolder(folderId=folderId, metadata=metadata)
+        # Paths of the global output directory and each workflow directory
+        workflow_ids = list(self._workflows)
+        paths = [self._vip_output_dir] + [self._workflows[wid]["output_path"] for wid in workflow_ids]
+        # Function to send the metadata, given the Girder IDs of `paths`
+        def send_metadata(folder_ids: list) -> str:
+            # Session metadata for the global output directory & metadata for each workflow
+            folders_metadata = [(folder_ids[0], session_data)] + [
+                (workflow_folderId, self._meta_workflow(workflow_id=workflow_id)) 
+                for workflow_folderId, workflow_id in zip(folder_ids[1:], workflow_ids)
+            ]
+            # Send only the metadata keys that changed since the last save (Girder merges metadata keys)
+            changed = {}
+            for folder_id, metadata in folders_metadata:
+                saved = self._saved_metadata.get(folder_id, {})
+                serialized = {key: json.dumps(value, sort_keys=True, default=str) for key, value in metadata.items()}
+                delta = {key: value for key, value in metadata.items() if saved.get(key) != serialized[key]}
+                if delta:
+                    changed[folder_id] = delta, serialized
+            self._bulk_add_metadata([(folder_id, delta) for folder_id, (delta, _) in changed.items()])
+            self._saved_metadata.update({folder_id: serialized for folder_id, (_, serialized) in changed.items()})
+            return folder_ids[0]
+        # -- End of send_metadata() --
+        folderId = self._with_girder_ids(paths, send_metadata)
         # Display
         self._print()
         if is_new:
@@ -447,14 +563,21 @@ class VipCI(VipLauncher):
         # Check the output directory is defined
         if self.vip_output_dir is None: 
             return None
+        # Check the output directory exists on Girder (without a failed lookup)
+        if not (
+            self.vip_output_dir.startswith(self._SERVER_PATH_PREFIX + "/") 
+            and self._exists(self._vip_output_dir, location=location)
+        ):
+            return None
         # Load the metadata on Girder
         with self._silent_class():
             try:
-                girder_id, _ = self._girder_path_to_id(self.vip_output_dir)
-                folder = self._girder_client.getFolder(folderId=girder_id)
+                folder = self._girder_client.getFolder(folderId=self._vip_output_dir_id)
             except girder_client.HttpError as e:
-                if e.status == 400: # Folder was not found
+                if e.status in (400, 404): # Folder was not found (the cached ID is outdated)
+                    self._invalidate_path_cache(self._vip_output_dir)
                     return None
+                raise e
         # Display success if the folder was found
         self._print("<< Session restored from its output directory\n")
         # Return session metadata
@@ -465,6 +588,29 @@ class VipCI(VipLauncher):
     # Manipulate Resources on Girder #
     ##################################
 
+    # Function to create a persistent HTTP session for the Girder client
+    @classmethod
+    def _new_girder_session(cls) -> requests.Session:
+        """
+        Returns a `requests` Session with a retry strategy and a connection pool 
+        large enough for `cls._MAX_THREADS` parallel requests to Girder.
+        """
+        # Strategy for retrying requests
+        retry_strategy = requests.adapters.Retry(
+            total = 3, 
+            status_forcelist = [502, 503, 504],
+            backoff_factor = 0.2
+        )
+        # Mount the connection pool on the Girder portal
+        session = requests.Session()
+        session.mount(cls._GIRDER_PORTAL, requests.adapters.HTTPAdapter(
+            pool_connections = cls._MAX_THREADS,
+            pool_maxsize = cls._MAX_THREADS,
+            max_retries = retry_strategy
+        ))
+        return session
+    # ------------------------------------------------
+
     # Function to get a resource ID
     @classmethod
     def _girder_path_to_id(cls, path) -> tuple[str, str]:
@@ -475,7 +621,12 @@ class VipCI(VipLauncher):
 
         Raises `girder_client.HttpError` if the resource was not found. 
         Adds intepretation message unless `cls._VERBOSE` is False.
+
+        Results are cached by path in `cls._GIRDER_IDS`.
         """
+        # Return the cached result if the resource was already found
+        if str(path) in cls._GIRDER_IDS:
+            return cls._GIRDER_IDS[str(path)]
         try :
             resource = cls._girder_client.resourceLookup(str(path))
         except girder_client.HttpError as e:
@@ -486,10 +637,87 @@ class VipCI(VipLauncher):
             raise e
         # Return the resource ID and type
         try:
-            return resource['_id'], resource['_modelType']
+            cls._GIRDER_IDS[str(path)] = resource['_id'], resource['_modelType']
         except KeyError as ke:
             cls._printc(f"Unhandled type of resource: \n\t{resource}\n")
             raise ke
+        return cls._GIRDER_IDS[str(path)]
+    # ------------------------------------------------
+
+    # Function to get multiple resource IDs
+    @classmethod
+    def _girder_paths_to_ids(cls, paths: list) -> list:
+        """
+        Returns the ID and type of each resource in `paths`, in the same order (see `_girder_path_to_id()`).
+        Paths that are not cached yet are looked up once each, with parallel requests.
+        """
+        # Look up the unknown paths
+        missing = {str(path) for path in paths if str(path) not in cls._GIRDER_IDS}
+        cls._map_parallel(cls._girder_path_to_id, missing, vip_sessions=False)
+        # Return the results in order (from the cache)
+        return [cls._girder_path_to_id(path) for path in paths]
+    # ------------------------------------------------
+
+    # Function to send requests with cached resource IDs
+    @classmethod
+    def _with_girder_ids(cls, paths: list, func):
+        """
+        Returns `func(ids)`, where `ids` is the list of Girder IDs for `paths` (see `_girder_paths_to_ids()`).
+
+        Cached IDs are outdated if the resources were removed from Girder since they were found.
+        If `func` fails with status 400 or 404, `paths` are looked up again and `func` is retried 
+        once with the new IDs. Raises `girder_client.HttpError` if some resource does not exist anymore.
+        """
+        ids = [id for id, _ in cls._girder_paths_to_ids(paths)]
+        try:
+            return func(ids)
+        except girder_client.HttpError as e:
+            if e.status not in (400, 404):
+                raise e
+            # Look up the resources again
+            for path in paths:
+                cls._invalidate_path_cache(path)
+            new_ids = [id for id, _ in cls._girder_paths_to_ids(paths)]
+            # Raise the original error if it did not come from the cache
+            if new_ids == ids:
+                raise e
+            return func(new_ids)
+    # ------------------------------------------------
+
+    # Function to forget the cached ID of a resource
+    @classmethod
+    def _invalidate_path_cache(cls, path) -> None:
+        """
+        Removes `path` and the resources below `path` from the caches of Girder IDs and paths.
+        `path` can be a string or PathLib object.
+        """
+        prefix = str(path).rstrip("/") + "/"
+        for cached_path in list(cls._GIRDER_IDS):
+            if cached_path == str(path) or cached_path.startswith(prefix):
+                cls._GIRDER_IDS.pop(cached_path, None)
+        for cached_id, cached_path in list(cls._GIRDER_PATHS.items()):
+            if str(cached_path) == str(path) or str(cached_path).startswith(prefix):
+                cls._GIRDER_PATHS.pop(cached_id, None)
+    # ------------------------------------------------
+    
+    # Function to add metadata to multiple folders
+    @classmethod
+    def _bulk_add_metadata(cls, folders_metadata: list) -> None:
+        """
+        Adds metadata to Girder folders with parallel requests.
+        `folders_metadata` must be a list of tuples in format: (`folderId`, `metadata`).
+        """
+        # Return if there is nothing to add
+        if not folders_metadata:
+            return
+        # Send the metadata
+        cls._map_parallel(
+            lambda folder_metadata: cls._girder_client.addMetadataToFolder(
+                folderId=folder_metadata[0], metadata=folder_metadata[1]
+            ),
+            folders_metadata,
+            vip_sessions=False
+        )
     # ------------------------------------------------
     
     # Function to get a resource path
@@ -500,14 +728,23 @@ class VipCI(VipLauncher):
         The resource `type` (item, folder, collection) must be provided.
 
         Raises `girder_client.HttpError` if the resource was not found.
+
+        Results are cached by ID in `cls._GIRDER_PATHS`.
         """
+        # Return the cached result if the resource was already found
+        if id in cls._GIRDER_PATHS:
+            return cls._GIRDER_PATHS[id]
         try :
-            return PurePosixPath(cls._girder_client.get(f"/resource/{id}/path", {"type": type}))
+            path = PurePosixPath(cls._girder_client.get(f"/resource/{id}/path", {"type": type}))
         except girder_client.HttpError as e:
             if e.status == 400:
                 cls._printc(f"(!) Invalid Girder ID: {id} with resource type:{type}")
                 cls._printc("    Original error from Girder API:")
             raise e
+        # Record the resource both ways
+        cls._GIRDER_PATHS[id] = path
+        cls._GIRDER_IDS[str(path)] = id, type
+        return path
     # ------------------------------------------------
     
     # Function to convert a Girder ID to Girder-VIP standard
@@ -519,12 +756,12 @@ class VipCI(VipLauncher):
         """
         if isinstance(resource, str):
             # Prefix the ID
-            return ":".join([cls._GIRDER_ID_PREFIX, resource])
+            return cls._VIP_GIRDER_ID_PREFIX + resource
         elif isinstance(resource, PurePath):
             # Get the Girder ID
             girder_id, _ = cls._girder_path_to_id(resource)
             # Prefix the ID
-            return ":".join([cls._GIRDER_ID_PREFIX, girder_id])
+            return cls._VIP_GIRDER_ID_PREFIX + girder_id
     # ------------------------------------------------
 
     ###################################################################
@@ -543,8 +780,9 @@ class VipCI(VipLauncher):
         # Function to extract file from Girder item
         def get_file_from_item(itemId: str) -> str:
             """Returns the Girder ID of a single file contained in `itemId`"""
+            # A single page of 2 files is enough to check there is only 1 file
             files = [
-                f["_id"] for f in self._girder_client.listFile(itemId=itemId)
+                f["_id"] for f in self._girder_client.listFile(itemId=itemId, limit=2)
             ]
             # Check the number of files (1 per item)
             if len(files) != 1:
@@ -553,38 +791,46 @@ class VipCI(VipLauncher):
                 raise NotImplementedError(msg)
             return files[0]
         # -- End of get_file_from_item() --
+        # Function to get the Girder path of the file contained in `itemId`
+        def get_path_from_item(itemId: str) -> PurePosixPath:
+            """Returns the Girder path of the single file contained in `itemId`"""
+            fileId = get_file_from_item(itemId)
+            # The file is also recorded for the next lookups (e.g., in `_vip_girder_id()`)
+            return self._girder_id_to_path(id=fileId, type='file')
+        # -- End of get_path_from_item() --
+        # Files already found in this call, by input path
+        found_files = {}
         # Function to extract all files from a Girder resource
         def get_files(input_path: str):
             """
             Returns the path of all files contained in the Girder resource pointed by `input_path`.
             The Girder resource can be a file, an item with 1 file or a folder with multiple items.
+            Each resource is browsed once, even if several parameters point to it.
             """
+            if str(input_path) in found_files:
+                files = found_files[str(input_path)]
+                return list(files) if isinstance(files, list) else files
             # Look up for the resource in Girder & get the Girder ID
             girder_id, girder_type = self._girder_path_to_id(input_path)
             # Retrieve all files based on the resource type
             if girder_type == "file":
                 # Return the Girder path
-                return PurePosixPath(input_path)
+                files = PurePosixPath(input_path)
             elif girder_type == "item":
-                # Retrieve the corresponding file
-                fileId = get_file_from_item(girder_id)
-                # Return the Girder path
-                return self._girder_id_to_path(id=fileId, type='file')
+                # Retrieve the corresponding file & return the Girder path
+                files = get_path_from_item(girder_id)
             elif girder_type == "folder":
-                # Retrieve all items
-                items = [ it["_id"] for it in self._girder_client.listItem(folderId=girder_id) ]
-                new_inputs = []
-                # Browse items
-                for itemId in items:
-                    # Retrieve the corresponding file
-                    fileId = get_file_from_item(itemId)
-                    # Update the file list with new Girder path
-                    new_inputs.append(self._girder_id_to_path(id=fileId, type='file'))
-                # Return the list of files
-                return new_inputs
+                # Browse items (listed page by page) and retrieve their files with parallel requests
+                files = self._map_parallel(
+                    get_path_from_item, 
+                    (it["_id"] for it in self._girder_client.listItem(folderId=girder_id)),
+                    vip_sessions=False
+                )
             else: 
                 # Girder type = collection or other
                 raise ValueError(f"Bad resource: {input_path}\n\tGirder type '{girder_type}' is not permitted in this context.")
+            found_files[str(input_path)] = files
+            return files
         # -- End of get_files() --
         # Function to parse Girder paths
         def parse_value(input):
@@ -655,6 +901,28 @@ class VipCI(VipLauncher):
         }
     # ------------------------------------------------
 
+    # Check the input files exist on Girder
+    def _check_input_files(self, input_settings: dict, location: str) -> None:
+        """
+        Checks if each File parameter in `input_settings` points to existing file(s).
+        Input files are always looked up again on Girder (with parallel requests), 
+        since they may have been removed after they were cached.
+        """
+        if location == "girder":
+            # Gather the input files
+            files = []
+            for param in self._pipeline_def['parameters']:
+                if param["type"] == "File" and param['name'] in input_settings:
+                    value = input_settings[param['name']]
+                    files += value if isinstance(value, list) else [value]
+            # Forget the cached resources & look them up again
+            for file in files:
+                self._invalidate_path_cache(file)
+            self._map_parallel(lambda file: self._exists(file, location=location), files, vip_sessions=False)
+        # Check the files (from the refreshed cache)
+        super()._check_input_files(input_settings, location=location)
+    # ------------------------------------------------
+
 ######################################################
         
 if __name__=="__main__":
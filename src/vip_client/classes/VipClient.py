@@ -28,6 +28,8 @@ class VipClient():
     _VIP_SUPPORT = "vip-support@creatis.insa-lyon.fr"
     # Regular expression for invalid characters
     _INVALID_CHARS = re.compile(r"[^0-9\.,A-Za-z\-+@/_(): \[\]?&=]")
+    # Regular expression for HTML tags & newlines in VIP descriptions
+    _HTML_TAGS = re.compile(r"<[^>]+>|\n")
 
                     ################
     ################ Public Methods ##################
@@ -43,9 +45,10 @@ class VipClient():
         ## Parameters
         - `api_key` (str): VIP API key. This can be either:
             A. [unsafe] A **string litteral** containing your API key,
-            B. [safer] A **path to some local file** containing your API key,
-            C. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY").
-        In cases B or C, the API key will be loaded from the local file or the environment variable. 
+            B. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY"),
+            C. [safer] A **path to some local file** containing your API key.
+        In cases B or C, the API key will be loaded from the environment variable or the local file. 
+        If `api_key` is both the name of an environment variable and a path to a local file, the environment variable is used.
         
         - `verbose` (bool): default verbose mode for all instances.
             - If True, all instances will display logs by default;
@@ -55,7 +58,7 @@ class VipClient():
         """
         # Set the default verbose mode for all sessions
         cls._VERBOSE = verbose
-        # Check if `api_key` is in a local file or environment variable
+        # Check if `api_key` is in an environment variable or local file
         true_key = cls._get_api_key(api_key)
         # Set User API key
         try:
@@ -162,12 +165,17 @@ class VipClient():
         cls._delete_path(path, location)
         # Standby until path is indeed removed (give up after some time)
         start = time.time()
-        t = time.time() - start
-        while (t < timeout) and cls._exists(path, location):
-            time.sleep(2)
+        waiting_time = 0.5
+        while cls._exists(path, location):
             t = time.time() - start
-        # Check if the data have indeed been removed
-        return (t < timeout)
+            # The data have not been removed in time
+            if t >= timeout:
+                return False
+            # Wait longer each time (up to 16 seconds) without exceeding the timeout
+            time.sleep(min(waiting_time, timeout - t))
+            waiting_time = min(waiting_time * 2, 16)
+        # The data have been removed
+        return True
     # ------------------------------------------------
     
     ##########################################################
@@ -196,9 +204,9 @@ class VipClient():
         cls._create_dir(path=first_node, location=location, **kwargs)
         # Make the other nodes one by one
         dir_to_make = first_node
-        while dir_to_make != path:
+        for part in path.relative_to(first_node).parts:
             # Find the next directory to make
-            dir_to_make /= path.relative_to(dir_to_make).parts[0]
+            dir_to_make /= part
             # Make the directory
             cls._create_dir(path=dir_to_make, location=location, **kwargs)
         # Return the created nodes
@@ -229,16 +237,17 @@ class VipClient():
         """
         - `api_key` (str): VIP API key. This can be either:
             A. [unsafe] A **string litteral** containing your API key,
-            B. [safer] A **path to some local file** containing your API key,
-            C. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY").
-        In cases B or C, the API key will be loaded from the local file or the environment variable. 
+            B. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY"),
+            C. [safer] A **path to some local file** containing your API key.
+        In cases B or C, the API key will be loaded from the environment variable or the local file. 
+        If `api_key` is both the name of an environment variable and a path to a local file, the environment variable is used.
         """
-        # Check if `api_key` is in a local file or environment variable
-        if os.path.isfile(api_key): # local file
+        # Check if `api_key` is in an environment variable or local file
+        if api_key in os.environ: # environment variable (no file system access)
+            true_key = os.environ[api_key]
+        elif os.path.isfile(api_key): # local file
             with open(api_key, "r") as kfile:
                 true_key = kfile.read().strip()
-        elif api_key in os.environ: # environment variable
-            true_key = os.environ[api_key]
         else: # string litteral
             true_key = api_key
         # Return
@@ -259,10 +268,10 @@ class VipClient():
     # ------------------------------------------------
 
     # Function to clean HTML text when loaded from VIP portal
-    @staticmethod
-    def _clean_html(text: str) -> str:
+    @classmethod
+    def _clean_html(cls, text: str) -> str:
         """Returns `text` without html tags and newline characters."""
-        return re.sub(r'<[^>]+>|\n', '', text)
+        return cls._HTML_TAGS.sub('', text)
 
     ########################################
     # SESSION LOGS & USER VIEW
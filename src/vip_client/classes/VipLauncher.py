@@ -4,6 +4,7 @@ import os
 import re
 import textwrap
 import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager, nullcontext
 from pathlib import *
 
@@ -54,8 +55,24 @@ class VipLauncher():
     _VIP_SUPPORT = "vip-support@creatis.insa-lyon.fr"
     # Regular expression for invalid characters (i.e. all except valid characters)
     _INVALID_CHARS_FOR_VIP = re.compile(r"[^0-9\.,A-Za-z\-+@/_(): \[\]?&=]")
+    # Regular expression for invalid characters in session names
+    _INVALID_CHARS_FOR_SESSION_NAME = re.compile(r"[^0-9A-Za-z\-_]+")
+    # Regular expression for HTML tags & newlines in VIP descriptions
+    _HTML_TAGS = re.compile(r"<[^>]+>|\n")
     # List of pipelines available to the user (will evolve after init())
     _AVAILABLE_PIPELINES = []
+    # Workflow status of executions which are still active on VIP
+    _ACTIVE_STATUS = frozenset({"Initializing", "Ready", "Running"})
+    # Definitions of the pipelines already requested to VIP, by pipeline identifier
+    _PIPELINE_DEFS = {}
+    # Names of the required / known parameters of the pipelines already checked, by pipeline identifier
+    _PIPELINE_FIELDS = {}
+    # Maximum number of parallel threads for I/O-bound requests
+    _MAX_THREADS = 10
+    # First waiting time (seconds) between status updates in monitor_workflows()
+    _FIRST_REFRESH_TIME = 2
+    # Growth factor of the waiting time between status updates
+    _REFRESH_BACKOFF = 1.5
 
                     #####################
     ################ Instance Properties ##################
@@ -78,7 +95,7 @@ class VipLauncher():
         if not isinstance(name, str):
             raise TypeError("`session_name` should be a string")
         # Check the name for invalid characters
-        if re.search(r"[^0-9A-Za-z\-_]+", name):
+        if self._INVALID_CHARS_FOR_SESSION_NAME.search(name):
             raise ValueError("Session name must contain only alphanumeric characters and hyphens '-', '_'")
         # Check conflict with private attribute
         if self._is_defined("_session_name"):
@@ -383,9 +400,10 @@ class VipLauncher():
         ## Parameters
         - `api_key` (str): VIP API key. This can be either:
             A. [unsafe] A **string litteral** containing your API key,
-            B. [safer] A **path to some local file** containing your API key,
-            C. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY").
-        In cases B or C, the API key will be loaded from the local file or the environment variable. 
+            B. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY"),
+            C. [safer] A **path to some local file** containing your API key.
+        In cases B or C, the API key will be loaded from the environment variable or the local file. 
+        If `api_key` is both the name of an environment variable and a path to a local file, the environment variable is used.
         
         - `verbose` (bool): default verbose mode for all instances.
             - If True, all instances will display logs by default;
@@ -395,7 +413,7 @@ class VipLauncher():
         """
         # Set the default verbose mode for all sessions
         cls._VERBOSE = verbose
-        # Check if `api_key` is in a local file or environment variable
+        # Check if `api_key` is in an environment variable or local file
         true_key = cls._get_api_key(api_key)
         # Set User API key
         try:
@@ -410,6 +428,9 @@ class VipLauncher():
             # setApiKey() may throw JSONDecodeError in special cases
             cls._printc(f"(!) Unable to set the VIP API key: {true_key}.\n    Original error message:")
             raise json_error
+        # Forget pipeline definitions requested with previous credentials
+        cls._PIPELINE_DEFS.clear()
+        cls._PIPELINE_FIELDS.clear()
         # Update the list of available pipelines
         try:
             cls._get_available_pipelines() # RunTimeError is handled downstream
@@ -502,17 +523,27 @@ class VipLauncher():
         self._print("-------------------------------------")
         self._print("Execution Name:", self._session_name)
         self._print("Started Workflows:", end="\n\t")
-        # Launch all executions in parallel
-        for nEx in range(nb_runs):
-            # Initiate execution
-            try:
-                workflow_id = self._init_exec()
-            # This part may fail for a number of reasons
-            except Exception as e: 
-                self._print("\n-------------------------------------")
-                self._print(f"(!) Stopped after {nEx} execution(s).\n")
-                self._save()
-                raise e from None
+        # Initiate a first execution alone, so that systematic errors (e.g., API key) are raised once
+        try:
+            workflow_ids = [self._init_exec()]
+        except Exception as e:
+            self._print("\n-------------------------------------")
+            self._print("(!) Stopped after 0 execution(s).\n")
+            self._save()
+            raise e from None
+        # Initiate the other executions with parallel threads
+        errors = []
+        if nb_runs > 1:
+            with self._thread_pool() as executor:
+                launches = [executor.submit(self._init_exec) for _ in range(nb_runs - 1)]
+            for launch in launches:
+                # Initiation may fail for a number of reasons
+                if launch.exception() is not None:
+                    errors.append(launch.exception())
+                else:
+                    workflow_ids.append(launch.result())
+        # Browse executions in launching order
+        for workflow_id in workflow_ids:
             # Display
             self._print(workflow_id, end=", ")
             # Get workflow informations
@@ -522,10 +553,13 @@ class VipLauncher():
                 self._save()
                 raise e from None
             # Create or update workflow entry (depends on init_exec())
-            if workflow_id in self._workflows: 
-                self._workflows[workflow_id].update(exec_infos)
-            else: 
-                self._workflows[workflow_id] = exec_infos
+            self._workflows.setdefault(workflow_id, {}).update(exec_infos)
+        # Raise the first error once the started executions are registered
+        if errors:
+            self._print("\n-------------------------------------")
+            self._print(f"(!) {len(errors)} execution(s) out of {nb_runs} could not be started.\n")
+            self._save()
+            raise errors[0] from None
         # End the application launch
         self._print("\n-------------------------------------")
         self._print("Done.")
@@ -539,7 +573,8 @@ class VipLauncher():
     def monitor_workflows(self, refresh_time=30) -> VipLauncher:
         """
         Updates and displays status for each execution launched in the current session.
-        - If an execution is still running, updates status every `refresh_time` (seconds) until all runs are done.
+        - If an execution is still running, updates status until all runs are done. 
+          The waiting time between updates starts at a few seconds and grows up to `refresh_time` (seconds).
         - Displays a full report when all executions are done.
 
         Error profile:
@@ -566,25 +601,38 @@ class VipLauncher():
             self._print(f"\t{self._VIP_PORTAL}")
             self._print("-------------------------------------------------------------")
             # Standby until all executions are over
-            time.sleep(refresh_time)
-            while self._still_running():
-                # Keep track of time
-                start = time.time()
-                # Update the workflow status & discard connection errors
-                try:
-                    self._update_workflows()
-                except Exception as e:
-                    # Print warning message
-                    self._print("(!) Connection with VIP was interrupted following an unexpected error (see below).")
-                    self._print("    This does not affect your executions on VIP servers.")
-                    self._print("    Relaunch monitor_workflows() or visit the VIP portal to see their current status.\n")
-                    # Save the session
-                    self._save()
-                    # Raise the error
-                    raise e
-                # Sleep until next itertation
-                elapsed_time = time.time() - start
-                time.sleep(max(refresh_time - elapsed_time, 0))
+            waiting_time = min(self._FIRST_REFRESH_TIME, refresh_time)
+            time.sleep(waiting_time)
+            # The same threads (& connections to VIP) are used for every update
+            with self._thread_pool() as executor:
+                while self._still_running():
+                    # Keep track of time
+                    start = time.time()
+                    # Update the status of unfinished workflows & discard connection errors
+                    running = self._running_workflows()
+                    try:
+                        self._refresh_workflows(running, executor=executor)
+                    except Exception as e:
+                        # Print warning message
+                        self._print("(!) Connection with VIP was interrupted following an unexpected error (see below).")
+                        self._print("    This does not affect your executions on VIP servers.")
+                        self._print("    Relaunch monitor_workflows() or visit the VIP portal to see their current status.\n")
+                        # Save the session
+                        self._save()
+                        # Raise the error
+                        raise e
+                    # Stop waiting if all executions are over
+                    still_running = self._still_running()
+                    if not still_running:
+                        break
+                    # Sleep until next itertation (longer each time, up to `refresh_time`),
+                    # or restart from the first waiting time when some execution has just ended
+                    if still_running < len(running):
+                        waiting_time = min(self._FIRST_REFRESH_TIME, refresh_time)
+                    else:
+                        waiting_time = min(waiting_time * self._REFRESH_BACKOFF, refresh_time)
+                    elapsed_time = time.time() - start
+                    time.sleep(max(waiting_time - elapsed_time, 0))
             # Display the end of executions
             self._print("All executions are over.")
         # Last execution report
@@ -673,13 +721,25 @@ class VipLauncher():
             removed_outputs = success
         else:
             removed_outputs = True
+        # Output directory of each workflow (when the output list is not empty)
+        output_dirs = {
+            wid: PurePosixPath(workflow["outputs"][0]["path"]).parent
+            for wid, workflow in self._workflows.items() if workflow["outputs"]
+        }
+        # Check each distinct directory once, with parallel requests
+        distinct_dirs = list(set(output_dirs.values()))
+        existing_dirs = {
+            output_dir for output_dir, exists in zip(
+                distinct_dirs, self._map_parallel(lambda path: self._exists(path, location="vip"), distinct_dirs)
+            ) if exists
+        }
         for wid in self._workflows:
             self._print(f"{wid}: ", end="", flush=True)
             if (
                 # The output list is empty
-                not self._workflows[wid]["outputs"] 
+                wid not in output_dirs
                 # Workflow's output directory does not exist anymore
-                or not self._exists(PurePosixPath(self._workflows[wid]["outputs"][0]["path"]).parent, location="vip")
+                or output_dirs[wid] not in existing_dirs
             ):
                 # Set the workflow status to "Removed"
                 self._workflows[wid]["status"] = "Removed"
@@ -730,9 +790,10 @@ class VipLauncher():
             )
         # Find all case-insensitive partial matches between `pipeline_id` and cls._AVAILABLE_PIPELINES
         if pipeline_id:            
+            pattern = pipeline_id.lower()
             pipelines = [
                 pipe for pipe in cls._AVAILABLE_PIPELINES
-                if pipeline_id.lower() in pipe.lower()
+                if pattern in pipe.lower()
             ]
         else: # In case no argument is given
             pipelines = cls._AVAILABLE_PIPELINES
@@ -823,7 +884,7 @@ class VipLauncher():
         del session_data["session_name"]
         # Print the rest
         for prop in session_data:
-            self._print(f"{prop}: {json.dumps(session_data[prop], indent=3)}")
+            self._print(f"{prop}: {json.dumps(session_data[prop], indent=3, default=str)}")
         self._print("-"*len(name_str))
         # End the display 
         self._print()
@@ -928,12 +989,17 @@ class VipLauncher():
         cls._delete_path(path, location)
         # Standby until path is indeed removed (give up after some time)
         start = time.time()
-        t = time.time() - start
-        while (t < timeout) and cls._exists(path, location):
-            time.sleep(2)
+        waiting_time = 0.5
+        while cls._exists(path, location):
             t = time.time() - start
-        # Check if the data have indeed been removed
-        return (t < timeout)
+            # The data have not been removed in time
+            if t >= timeout:
+                return False
+            # Wait longer each time (up to 16 seconds) without exceeding the timeout
+            time.sleep(min(waiting_time, timeout - t))
+            waiting_time = min(waiting_time * 2, 16)
+        # The data have been removed
+        return True
     # ------------------------------------------------
     
     ##########################################################
@@ -962,15 +1028,63 @@ class VipLauncher():
         cls._create_dir(path=first_node, location=location, **kwargs)
         # Make the other nodes one by one
         dir_to_make = first_node
-        while dir_to_make != path:
+        for part in path.relative_to(first_node).parts:
             # Find the next directory to make
-            dir_to_make /= path.relative_to(dir_to_make).parts[0]
+            dir_to_make /= part
             # Make the directory
             cls._create_dir(path=dir_to_make, location=location, **kwargs)
         # Return the created nodes
         return str(path.relative_to(first_node.parent))
     # ------------------------------------------------
     
+    # Context manager for a pool of threads dedicated to I/O-bound requests
+    @classmethod
+    @contextmanager
+    def _thread_pool(cls, vip_sessions=True) -> ThreadPoolExecutor:
+        """
+        Yields an executor with at most `cls._MAX_THREADS` parallel threads.
+        If `vip_sessions` is True, each thread communicates with VIP through its own `requests` Session 
+        (see `vip.init_thread()`). These sessions are closed when the executor is shut down.
+        """
+        # Sessions opened by the threads
+        sessions = []
+        initializer = (lambda: sessions.append(vip.init_thread())) if vip_sessions else None
+        try:
+            with ThreadPoolExecutor(
+                max_workers = cls._MAX_THREADS, 
+                thread_name_prefix = "vip_client",
+                initializer = initializer
+            ) as executor:
+                yield executor
+        finally:
+            # Close the connections to VIP
+            for session in sessions:
+                session.close()
+    # ------------------------------------------------
+
+    # Method to run I/O-bound requests with parallel threads
+    @classmethod
+    def _map_parallel(cls, func, iterable, vip_sessions=True, executor=None) -> list:
+        """
+        Returns the list of `func(element)` for each element of `iterable`, in the same order.
+        - Calls to `func` are run with parallel threads (see `_thread_pool()`), 
+          or in the current thread if `iterable` contains a single element;
+        - Set `vip_sessions` to False if `func` does not communicate with VIP (e.g., Girder requests);
+        - Provide `executor` to reuse the threads of an existing pool;
+        - If some call raises an exception, this exception is raised once all threads are over.
+        """
+        elements = list(iterable)
+        # Case: no need for parallel threads
+        if len(elements) <= 1:
+            return [func(element) for element in elements]
+        # Case: existing pool
+        if executor is not None:
+            return list(executor.map(func, elements))
+        # Threads are run in a context manager to secure their closing
+        with cls._thread_pool(vip_sessions=vip_sessions) as executor:
+            return list(executor.map(func, elements))
+    # ------------------------------------------------
+    
     # Generic method to get session properties
     def _get(self, *args):
         """
@@ -1049,16 +1163,17 @@ class VipLauncher():
         """
         - `api_key` (str): VIP API key. This can be either:
             A. [unsafe] A **string litteral** containing your API key,
-            B. [safer] A **path to some local file** containing your API key,
-            C. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY").
-        In cases B or C, the API key will be loaded from the local file or the environment variable. 
+            B. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY"),
+            C. [safer] A **path to some local file** containing your API key.
+        In cases B or C, the API key will be loaded from the environment variable or the local file. 
+        If `api_key` is both the name of an environment variable and a path to a local file, the environment variable is used.
         """
-        # Check if `api_key` is in a local file or environment variable
-        if os.path.isfile(api_key): # local file
+        # Check if `api_key` is in an environment variable or local file
+        if api_key in os.environ: # environment variable (no file system access)
+            true_key = os.environ[api_key]
+        elif os.path.isfile(api_key): # local file
             with open(api_key, "r") as kfile:
                 true_key = kfile.read().strip()
-        elif api_key in os.environ: # environment variable
-            true_key = os.environ[api_key]
         else: # string litteral
             true_key = api_key
         # Return
@@ -1101,14 +1216,9 @@ class VipLauncher():
         # Initiate status report
         report={}
         # Browse workflows
-        for wid in self._workflows:
-            # Get status
-            status = self._workflows[wid]["status"]
-            # Update the report
-            if status in report:
-                report[status].append(wid) # update status
-            else:
-                report[status] = [wid] # create status
+        for wid, workflow in self._workflows.items():
+            # Update the report (create the status if needed)
+            report.setdefault(workflow["status"], []).append(wid)
         # Interpret the report to the user
         if display:
             # Function to print a detailed worfklow list
@@ -1157,16 +1267,21 @@ class VipLauncher():
 
     def _still_running(self) -> int:
         """
-        Returns the number of workflows which are still running on VIP.
+        Returns the number of workflows which are still running (or about to run) on VIP.
         (!) Requires prior call to self._update_workflows to avoid unnecessary connexions to VIP
         """
         # Workflow count
-        count = 0
-        for wid in self._workflows:
-            # Update count
-            count += int(self._workflows[wid]["status"]=="Running")
-        # Return count
-        return count   
+        return sum(workflow["status"] in self._ACTIVE_STATUS for workflow in self._workflows.values())
+    # ------------------------------------------------
+
+    def _running_workflows(self) -> list:
+        """
+        Returns the identifiers of workflows which are still active on VIP (see `_ACTIVE_STATUS`).
+        """
+        return [
+            wid for wid, workflow in self._workflows.items()
+            if workflow["status"] in self._ACTIVE_STATUS
+        ]
     # ------------------------------------------------
 
     # Update all worflow information at once
@@ -1174,11 +1289,21 @@ class VipLauncher():
         """
         Updates the status of each workflow in the inventory. 
         """
-        for wid in self._workflows:
-            # Check if workflow data have been removed
-            if self._workflows[wid]["status"] != "Removed":
-                # Recall execution info & update the workflow status
-                self._workflows[wid].update(self._get_exec_infos(wid))
+        # Skip workflows whose data have been removed
+        self._refresh_workflows(
+            [wid for wid in self._workflows if self._workflows[wid]["status"] != "Removed"]
+        )
+    # ------------------------------------------------
+
+    # Method to update the status of several workflows at once
+    def _refresh_workflows(self, workflow_ids: list, executor=None) -> None:
+        """
+        Recalls execution info of `workflow_ids` in parallel & updates their status in the inventory.
+        Threads from `executor` are used if provided (see `_map_parallel()`).
+        """
+        infos_list = self._map_parallel(self._get_exec_infos, workflow_ids, executor=executor)
+        for wid, infos in zip(workflow_ids, infos_list):
+            self._workflows[wid].update(infos)
     # ------------------------------------------------
 
     # Method to get useful information about a given workflow
@@ -1325,11 +1450,8 @@ class VipLauncher():
             return NotImplementedError(f"Location '{location}' is unknown for {self.__name__}")
         # Display
         self._print(f"\nSaving session properties ...")
-        # Temporary file to save session data
-        tmp_file = Path("tmp_save.json")
-        # Save the data in JSON format
-        with tmp_file.open("w") as outfile:
-            json.dump(session_data, outfile, indent=4)
+        # Encode the data in JSON format (in memory)
+        content = json.dumps(session_data, indent=4).encode()
         # Path to the backup file on VIP
         vip_file = self._vip_output_dir / self._SAVE_FILE
         # Make the output directory if it does not exist
@@ -1337,10 +1459,8 @@ class VipLauncher():
         # Delete the previous file if it exists
         if not is_new:
             self._delete_and_check(vip_file, location=location, timeout=30)
-        # Send the temportary file on VIP (no error raised)
-        done = self._upload_file(tmp_file, vip_file)
-        # Delete the temporary file
-        tmp_file.unlink()
+        # Send the data on VIP (no error raised)
+        done = self._upload_content(content, vip_file)
         # Display
         self._print()
         if done and is_new: self._print(f">> Session was saved in: {vip_file}\n")
@@ -1368,18 +1488,13 @@ class VipLauncher():
         vip_file = self._vip_output_dir / self._SAVE_FILE
         if not self._exists(vip_file, location=location):
             return None
-        # Temporary file for download
-        tmp_file = Path("tmp_load.json")
-        # Download the file
-        done = self._download_file(vip_file, tmp_file)
-        if not (done and tmp_file.exists()):
+        # Download the file content (in memory)
+        content = self._download_content(vip_file)
+        if content is None:
             self._print("\n(!) Unable to load backup data from session's output directory\n")
             return None
-        # Load the JSON file
-        with tmp_file.open() as fid:
-            session_data = json.load(fid)
-        # Delete the temporary file
-        tmp_file.unlink()
+        # Load the JSON data
+        session_data = json.loads(content)
         # Display success
         self._print("<< Session restored from its output directory\n")
         # Return
@@ -1414,6 +1529,25 @@ class VipLauncher():
             return False
     # ------------------------------------------------   
 
+    # Function to download the content of a single file from VIP
+    @classmethod
+    def _download_content(cls, vip_path: PurePosixPath) -> bytes:
+        """
+        Returns the content of a single file in `vip_path`, or None if the download failed.
+        """
+        return vip.download_content(str(vip_path))
+    # ------------------------------------------------    
+    
+    # Function to upload some content in a single file on VIP
+    @classmethod
+    def _upload_content(cls, content: bytes, vip_path: PurePosixPath) -> bool:
+        """
+        Uploads `content` (bytes) to a single file in `vip_path`.
+        Returns a success flag.
+        """
+        return vip.upload_content(content, str(vip_path))
+    # ------------------------------------------------   
+
     ###############################################################
     # Prevent common mistakes in session / pipeline settings 
     ###############################################################
@@ -1489,11 +1623,35 @@ class VipLauncher():
         """
         Gets the full definition of `pipeline_id` from VIP.
         Raises RuntimeError if fails to communicate with VIP.
+
+        Definitions are requested once per pipeline and cached in `cls._PIPELINE_DEFS`.
         """
-        try :            
-            return vip.pipeline_def(pipeline_id)
-        except RuntimeError as vip_error:
-            cls._handle_vip_error(vip_error)
+        if pipeline_id not in cls._PIPELINE_DEFS:
+            try :            
+                cls._PIPELINE_DEFS[pipeline_id] = vip.pipeline_def(pipeline_id)
+            except RuntimeError as vip_error:
+                cls._handle_vip_error(vip_error)
+        return cls._PIPELINE_DEFS[pipeline_id]
+    # ------------------------------------------------
+
+    # Get the parameter names from the pipeline definition
+    @classmethod
+    def _get_pipeline_fields(cls, pipeline_id) -> tuple[frozenset, frozenset]:
+        """
+        Returns the names of the parameters of `pipeline_id` as two frozensets:
+        - the required parameters without a default value;
+        - all parameters.
+        """
+        if pipeline_id not in cls._PIPELINE_FIELDS:
+            parameters = cls._get_pipeline_def(pipeline_id)['parameters']
+            cls._PIPELINE_FIELDS[pipeline_id] = (
+                frozenset(
+                    param["name"] for param in parameters
+                    if not param["isOptional"] and (param["defaultValue"] == '$input.getDefaultValue()')
+                ),
+                frozenset(param["name"] for param in parameters)
+            )
+        return cls._PIPELINE_FIELDS[pipeline_id]
     # ------------------------------------------------
 
     # Store the VIP paths as PathLib objects
@@ -1569,7 +1727,9 @@ class VipLauncher():
         # Parameter names
         self._check_input_keys(input_settings)
         # Parameter values
-        self._check_input_values(input_settings, location=location)
+        self._check_input_values(input_settings)
+        # Input files
+        self._check_input_files(input_settings, location=location)
         # Return True when all checks are complete
         return True
     # ------------------------------------------------      
@@ -1579,15 +1739,12 @@ class VipLauncher():
         """
         Looks for mismatches in keys between `input_settings` and `_pipeline_def`.
         """
+        # Get the names of the required and known pipeline parameters
+        required_fields, known_fields = self._get_pipeline_fields(self._pipeline_id)
         # Check every required field is there 
         missing_fields = (
-            # required parameters without a default value
-            {
-                param["name"] for param in self._pipeline_def['parameters'] 
-                if not param["isOptional"] and (param["defaultValue"] == '$input.getDefaultValue()')
-            } 
-            # current parameters
-            - set(input_settings.keys()) 
+            required_fields # required parameters without a default value
+            - set(input_settings.keys()) # current parameters
         )
         # Raise an error if a field is missing
         if missing_fields:
@@ -1595,7 +1752,7 @@ class VipLauncher():
         # Check every input parameter is a valid field
         unknown_fields = (
             set(input_settings.keys()) # current parameters
-            - {param["name"] for param in self._pipeline_def['parameters']} # pipeline parameters
+            - known_fields # pipeline parameters
         )
         # Display a warning in case of useless inputs
         if unknown_fields :
@@ -1604,10 +1761,10 @@ class VipLauncher():
     # ------------------------------------------------
     
     # Check the parameter values according to pipeline descriptor
-    def _check_input_values(self, input_settings: dict, location: str) -> None:
+    def _check_input_values(self, input_settings: dict) -> None:
         """
         Checks if each parameter value in `input_settings` matches its pipeline description in `parameters`.
-        `location` refers to the storage infrastructure (e.g., VIP) to scan for missing files.
+        File existence is checked separately (see `_check_input_files()`).
 
         Prerequisite: input_settings is defined and contains only strings, or lists of strings.
         """
@@ -1637,16 +1794,29 @@ class VipLauncher():
                 raise ValueError(
                     f"Parameter '{name}' contains some invalid character(s): {', '.join(invalid)}"
                 )
-            # If input is a File, check file(s) existence 
-            if param["type"] == "File":
-                # Ensure every file exists at `location`
-                missing_file = self._first_missing_file(value, location)
-                if missing_file:
-                    raise FileNotFoundError(
-                        f"Parameter '{name}': The following file is missing in the {location.upper()} file system:\n\t{missing_file}"
-                    )
             # Check other input formats ?
-            else: pass # TODO
+            pass # TODO
+    # ------------------------------------------------
+
+    # Check the input files exist
+    def _check_input_files(self, input_settings: dict, location: str) -> None:
+        """
+        Checks if each File parameter in `input_settings` points to existing file(s).
+        `location` refers to the storage infrastructure (e.g., VIP) to scan for missing files.
+        """
+        # Browse the File parameters
+        for param in self._pipeline_def['parameters'] :
+            # Get parameter name
+            name = param['name']
+            # Skip irrelevant inputs
+            if param["type"] != "File" or name not in input_settings:
+                continue
+            # Ensure every file exists at `location`
+            missing_file = self._first_missing_file(input_settings[name], location)
+            if missing_file:
+                raise FileNotFoundError(
+                    f"Parameter '{name}': The following file is missing in the {location.upper()} file system:\n\t{missing_file}"
+                )
     # ------------------------------------------------
     
     # Function to look for empty values
@@ -1717,10 +1887,10 @@ class VipLauncher():
     ########################################
 
     # Function to clean HTML text when loaded from VIP portal
-    @staticmethod
-    def _clean_html(text: str) -> str:
+    @classmethod
+    def _clean_html(cls, text: str) -> str:
         """Returns `text` without html tags and newline characters."""
-        return re.sub(r'<[^>]+>|\n', '', text)
+        return cls._HTML_TAGS.sub('', text)
 
     # Interface for printing logs at instance level
     def _print(self, *args, min_space=-1, max_space=1, **kwargs) -> None:
@@ -1743,17 +1913,10 @@ class VipLauncher():
         # Get the number of blank lines at the end of last message
         if not self._is_defined("_blank_lines"):
             self._blank_lines = 0
-        # Function to count the number of newlines at the beginning of the message
-        def nb_nl(msg: str) -> int:
-            n = 0
-            for char in msg:
-                if char == '\n':  n += 1
-                else: break
-            return n
         # Function to get the desired number of newlines at the beginning of the message
         def nb_nl_start() -> int:
             # Newlines count
-            n_start = nb_nl(message)
+            n_start = len(message) - len(message.lstrip("\n"))
             # Lower an upper bounds for newlines count (accounting for self._blanklines)
             lower, upper = min_space - self._blank_lines, max_space - self._blank_lines
             # Return the framed value
@@ -1768,15 +1931,16 @@ class VipLauncher():
         # Function to get the desired number of newlines at the end of the message
         def nb_nl_end() -> int:
             # Newlines count
-            n_end = nb_nl(reversed(message))
+            n_end = len(message) - len(message.rstrip("\n"))
             # Lower an upper bounds for newlines count 
             lower, upper = min_space + 1, max_space + 1 # `+1` because the first newline is not a blank line
             # Return the framed value
             return n_end if (lower <= n_end <= upper) else upper if (n_end > upper) else lower
         # Reset the blank line count
-        self._blank_lines = nb_nl_end() - 1 
+        n_end = nb_nl_end()
+        self._blank_lines = n_end - 1 
         # Trim the newlines a the end of the message
-        message = message.rstrip("\n") + "\n" * nb_nl_end()
+        message = message.rstrip("\n") + "\n" * n_end
         # Print the message with the rest of keywords arguments
         self._printc(message, end='', **kwargs)
     # ------------------------------------------------
@@ -309,9 +309,10 @@ class VipLoader(VipClient):
     
     # Function to upload all files from a local directory
     @classmethod
-    def _upload_dir(cls, local_path: Path, vip_path: PurePosixPath) -> list:
+    def _upload_dir(cls, local_path: Path, vip_path: PurePosixPath, parent_is_new=False) -> list:
         """
         Uploads all files in `local_path` to `vip_path` (if needed).
+        If `parent_is_new` is True, the parent of `vip_path` was just created and `vip_path` is created without any check.
         Displays what it does if `cls._VERBOSE` is True.
         Returns a list of files which failed to be uploaded on VIP.
         """
@@ -319,8 +320,15 @@ class VipLoader(VipClient):
         assert cls._exists(local_path, location='local'), f"{local_path} does not exist."
         # First display
         cls._printc(f"Cloning: {local_path} ", end="... ")
+        # Create the distant directory if needed
+        if parent_is_new:
+            # The parent directory was just created -> no need to check existence
+            cls._create_dir(vip_path, location="vip")
+            is_new = True
+        else:
+            is_new = bool(cls._mkdirs(vip_path, location="vip"))
         # Scan the distant directory and look for files to upload
-        if cls._mkdirs(vip_path, location="vip"):
+        if is_new:
             # The distant directory did not exist before call
             # -> upload all the data (no scan to save time)
             files_to_upload = [
@@ -375,7 +383,8 @@ class VipLoader(VipClient):
         for subdir in subdirs:
             failures += cls._upload_dir(
                 local_path=subdir,
-                vip_path=vip_path/subdir.name
+                vip_path=vip_path/subdir.name,
+                parent_is_new=is_new
             )
         # Return the list of failures
         return failures
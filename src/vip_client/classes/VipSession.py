@@ -302,9 +302,10 @@ class VipSession(VipLauncher):
         ## Parameters
         - `api_key` (str): VIP API key. This can be either:
             A. [unsafe] A **string litteral** containing your API key,
-            B. [safer] A **path to some local file** containing your API key,
-            C. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY").
-        In cases B or C, the API key will be loaded from the local file or the environment variable. 
+            B. [safer] The **name of some environment variable** containing your API key (default: "VIP_API_KEY"),
+            C. [safer] A **path to some local file** containing your API key.
+        In cases B or C, the API key will be loaded from the environment variable or the local file. 
+        If `api_key` is both the name of an environment variable and a path to a local file, the environment variable is used.
         
         - `verbose` (bool): default verbose mode for all instances.
             - If True, all instances will display logs by default;
@@ -433,7 +434,7 @@ class VipSession(VipLauncher):
     def monitor_workflows(self, refresh_time=30) -> VipSession:
         """
         Updates and displays the status for each execution launched in the current session.
-        - If an execution is still running, updates status every `refresh_time` (seconds) until all runs are finished.
+        - If an execution is still running, updates status until all runs are finished, waiting up to `refresh_time` (seconds) between updates.
         - Displays a full report when all executions are done.
 
         Session is backed up at the end of the procedure.
@@ -789,9 +790,10 @@ class VipSession(VipLauncher):
     # ------------------------------------------------
 
     # Function to upload all files from a local directory
-    def _upload_dir(self, local_path: Path, vip_path: PurePosixPath) -> list:
+    def _upload_dir(self, local_path: Path, vip_path: PurePosixPath, parent_is_new=False) -> list:
         """
         Uploads all files in `local_path` to `vip_path` (if needed).
+        If `parent_is_new` is True, the parent of `vip_path` was just created and `vip_path` is created without any check.
         Displays what it does if `self._verbose` is True.
         Returns a list of files which failed to be uploaded on VIP.
         """
@@ -799,8 +801,15 @@ class VipSession(VipLauncher):
         assert self._exists(local_path, location='local'), f"{local_path} does not exist."
         # First display
         self._print(f"Cloning: {local_path} ", end="... ")
+        # Create the distant directory if needed
+        if parent_is_new:
+            # The parent directory was just created -> no need to check existence
+            self._create_dir(vip_path, location="vip")
+            is_new = True
+        else:
+            is_new = bool(self._mkdirs(vip_path, location="vip"))
         # Scan the distant directory and look for files to upload
-        if self._mkdirs(vip_path, location="vip"):
+        if is_new:
             # The distant directory did not exist before call
             # -> upload all the data (no scan to save time)
             files_to_upload = [
@@ -855,7 +864,8 @@ class VipSession(VipLauncher):
         for subdir in subdirs:
             failures += self._upload_dir(
                 local_path=subdir,
-                vip_path=vip_path/subdir.name
+                vip_path=vip_path/subdir.name,
+                parent_is_new=is_new
             )
         # Return the list of failures
         return failures
@@ -73,6 +73,15 @@ def init_thread()  -> requests.Session:
     """Creates a new thread-safe version of the `requests` Session with a retry strategy"""
     assert not hasattr(thread_local, "session")
     thread_local.session = new_session()
+    return thread_local.session
+
+# Function to get the Session object of the current thread
+def get_session() -> requests.Session:
+    """
+    Returns the thread-safe `requests` Session if the current thread was initialized 
+    with `init_thread()`, the global Session otherwise.
+    """
+    return getattr(thread_local, "session", SESSION)
 
 # -----------------------------------------------------------------------------
 def setApiKey(value) -> bool:
@@ -142,7 +151,7 @@ def create_dir(path)->bool:
     Return True if done, False otherwise
     """
     url = __PREFIX + 'path' + path
-    rq = SESSION.put(url, headers=__headers)
+    rq = get_session().put(url, headers=__headers)
     try:
         manage_errors(rq)
     except RuntimeError:
@@ -175,7 +184,7 @@ def _path_action(path, action) -> requests.models.Response:
     """
     assert action in ['list', 'exists', 'properties', 'md5']
     url = __PREFIX + 'path' + path + '?action=' + action
-    rq = SESSION.get(url, headers=__headers)
+    rq = get_session().get(url, headers=__headers)
     manage_errors(rq)
     return rq
 
@@ -212,7 +221,7 @@ def delete_path(path)->bool:
     Return True if done, False otherwise
     """
     url = __PREFIX + 'path' + path
-    rq = SESSION.delete(url, headers=__headers)
+    rq = get_session().delete(url, headers=__headers)
     try:
         manage_errors(rq)
     except RuntimeError:
@@ -226,6 +235,18 @@ def upload(path, where_to_save) -> bool:
     - `path` : on local computer, the file to upload
     - `where_to_save` : on VIP, something like "/vip/Home/RandomName.ext"
 
+    Return True if done, False otherwise
+    """
+    with open(path, 'rb') as fid:
+        data = fid.read()
+    return upload_content(data, where_to_save)
+
+# -----------------------------------------------------------------------------
+def upload_content(data, where_to_save) -> bool:
+    """
+    - `data` : bytes to upload (e.g., the content of a file)
+    - `where_to_save` : on VIP, something like "/vip/Home/RandomName.ext"
+
     Return True if done, False otherwise
     """
     url = __PREFIX + 'path' + where_to_save
@@ -233,9 +254,7 @@ def upload(path, where_to_save) -> bool:
                 'apikey': __apikey,
                 'Content-Type': 'application/octet-stream',
               }
-    with open(path, 'rb') as fid:
-        data = fid.read()
-    rq = SESSION.put(url, headers=headers, data=data)
+    rq = get_session().put(url, headers=headers, data=data)
     try:
         manage_errors(rq)
     except RuntimeError:
@@ -250,16 +269,28 @@ def download(path, where_to_save) -> bool :
     - `path`: on VIP, something like "/vip/Home/RandomName.ext", content to dl
     - `where_to_save` : on local computer
     """
-    # Parse arguments
-    url = __PREFIX + 'path' + path + '?action=content'
-    rq = SESSION.get(url, headers=__headers, stream=True)
-    if rq.status_code != 200:
+    content = download_content(path)
+    if content is None:
         return False
     else:
         with open(where_to_save, 'wb') as out_file:
-            out_file.write(rq.content)
+            out_file.write(content)
         return True
 
+# -----------------------------------------------------------------------------
+def download_content(path) -> bytes :
+    """
+    Returns the content of a single file from VIP (None if the download failed).
+    - `path`: on VIP, something like "/vip/Home/RandomName.ext", content to dl
+    """
+    # Parse arguments
+    url = __PREFIX + 'path' + path + '?action=content'
+    rq = get_session().get(url, headers=__headers, stream=True)
+    if rq.status_code != 200:
+        return None
+    else:
+        return rq.content
+
 # Methods for parallel downloads
     
 # Method to downlad data in a thread-safe session
@@ -306,14 +337,14 @@ def download_parallel(files):
 # -----------------------------------------------------------------------------
 def list_executions()->list:
     url = __PREFIX + 'executions'
-    rq = SESSION.get(url, headers=__headers)
+    rq = get_session().get(url, headers=__headers)
     manage_errors(rq)
     return rq.json()
 
 # -----------------------------------------------------------------------------
 def count_executions()->int:
     url = __PREFIX + 'executions/count'
-    rq = SESSION.get(url, headers=__headers)
+    rq = get_session().get(url, headers=__headers)
     manage_errors(rq)
     return int(rq.text)
 
@@ -330,7 +361,7 @@ def init_exec(pipeline, name="default", inputValues={}, resultsLocation="/vip/Ho
             "inputValues": inputValues,
             "resultsLocation": resultsLocation
            }
-    rq = SESSION.post(url, headers=headers, json=data_)
+    rq = get_session().post(url, headers=headers, json=data_)
     manage_errors(rq)
     return rq.json()["identifier"]
 # -----------------------------------------------------------------------------
@@ -354,7 +385,7 @@ def init_exec_without_resultsLocation(pipeline, name="default", inputValues={})
 # -----------------------------------------------------------------------------
 def execution_info(id_exec)->dict:
     url = __PREFIX + 'executions/' + id_exec
-    rq = SESSION.get(url, headers=__headers)
+    rq = get_session().get(url, headers=__headers)
     manage_errors(rq)
     return rq.json()
 
@@ -366,14 +397,14 @@ def is_running(id_exec)->bool:
 # -----------------------------------------------------------------------------
 def get_exec_stderr(exec_id) -> str:
     url = __PREFIX + 'executions/' + exec_id + '/stderr'
-    rq = SESSION.get(url, headers=__headers)
+    rq = get_session().get(url, headers=__headers)
     manage_errors(rq)
     return rq.text
 
 # -----------------------------------------------------------------------------
 def get_exec_stdout(exec_id) -> str:
     url = __PREFIX + 'executions/' + exec_id + '/stdout'
-    rq = SESSION.get(url, headers=__headers)
+    rq = get_session().get(url, headers=__headers)
     manage_errors(rq)
     return rq.text
 
@@ -399,7 +430,7 @@ def kill_execution(exec_id, deleteFiles=False) -> bool:
     url = __PREFIX + 'executions/' + exec_id
     if deleteFiles:
         url += '?deleteFiles=true'
-    rq = SESSION.delete(url, headers=__headers)
+    rq = get_session().delete(url, headers=__headers)
     try:
         manage_errors(rq)
     except RuntimeError:
@@ -411,14 +442,14 @@ def kill_execution(exec_id, deleteFiles=False) -> bool:
 # -----------------------------------------------------------------------------
 def list_pipeline()->list:
     url = __PREFIX + 'pipelines'
-    rq = SESSION.get(url, headers=__headers)
+    rq = get_session().get(url, headers=__headers)
     manage_errors(rq)
     return rq.json()
 
 # -----------------------------------------------------------------------------
 def pipeline_def(pip_id)->dict:
     url = __PREFIX + 'pipelines/' + pip_id
-    rq = SESSION.get(url, headers=__headers)
+    rq = get_session().get(url, headers=__headers)
     manage_errors(rq)
     return rq.json()
 
@@ -426,7 +457,7 @@ def pipeline_def(pip_id)->dict:
 # -----------------------------------------------------------------------------
 def platform_info()->dict:
     url = __PREFIX + 'platform'
-    rq = SESSION.get(url, headers=__headers)
+    rq = get_session().get(url, headers=__headers)
     manage_errors(rq)
     return rq.json()
 
@@ -444,7 +475,7 @@ def get_apikey(username, password)->str:
             "username": username, 
             "password": password
            }
-    rq = SESSION.post(url, headers=headers, json=data_)
+    rq = get_session().post(url, headers=headers, json=data_)
     manage_errors(rq)
     return rq.json()['httpHeaderValue']
 
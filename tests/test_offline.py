@@ -0,0 +1,690 @@
+"""
+Offline tests for the caches and parallel helpers of the VIP Python client.
+VIP and Girder are replaced by mocks: these tests do not need an API key.
+"""
+import itertools
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from pathlib import *
+
+try: # Use through unittest
+    from vip_client.utils import vip
+    from vip_client.classes import VipLauncher, VipCI, VipClient, VipLoader
+except ModuleNotFoundError: # Use as a script
+    import sys
+    SOURCE_ROOT = str(Path(__file__).parents[1] / "src") # <=> /src/
+    sys.path.append(SOURCE_ROOT)
+    from vip_client.utils import vip
+    from vip_client.classes import VipLauncher, VipCI, VipClient, VipLoader
+
+import girder_client
+
+# Pipeline definition returned by the mocked VIP API
+PIPELINE_DEF = {
+    "name": "Pipeline", "version": "1", "description": "<b>Test</b> pipeline",
+    "parameters": [
+        {"name": "input", "type": "File", "isOptional": False, "defaultValue": "$input.getDefaultValue()", "description": ""},
+        {"name": "n", "type": "String", "isOptional": True, "defaultValue": "1", "description": ""},
+        {"name": "m", "type": "String", "isOptional": False, "defaultValue": "2", "description": ""},
+    ]
+}
+# ------------------------------------------------------------------
+
+
+class FakeGirder():
+    """Minimal Girder client with resources stored by path"""
+
+    def __init__(self, *paths) -> None:
+        self.resources = {} # path -> (id, type)
+        self.metadata = {} # id -> metadata
+        self.calls = []
+        self.ids = itertools.count()
+        for path, type in paths:
+            self.add(path, type)
+
+    def add(self, path, type) -> str:
+        id = f"id{next(self.ids)}"
+        self.resources[path] = (id, type)
+        return id
+
+    def remove(self, path) -> None:
+        del self.resources[path]
+
+    def path_of(self, id) -> str:
+        return next(path for path, (rid, _) in self.resources.items() if rid == id)
+
+    def children(self, id, type) -> list:
+        parent = self.path_of(id)
+        return [
+            {"_id": rid} for path, (rid, rtype) in self.resources.items()
+            if path.rpartition("/")[0] == parent and rtype == type
+        ]
+
+    def resourceLookup(self, path):
+        self.calls.append(("resourceLookup", path))
+        if path not in self.resources:
+            raise girder_client.HttpError(400, "", "", "GET")
+        id, type = self.resources[path]
+        return {"_id": id, "_modelType": type}
+
+    def get(self, path, parameters=None, **kwargs):
+        self.calls.append(("get", path))
+        if path == "resource/lookup":
+            if parameters["path"] not in self.resources:
+                return None
+            id, type = self.resources[parameters["path"]]
+            return {"_id": id, "_modelType": type}
+        if path.startswith("/resource/") and path.endswith("/path"):
+            return self.path_of(path.split("/")[2])
+        raise NotImplementedError(path)
+
+    def listItem(self, folderId, **kwargs):
+        self.calls.append(("listItem", folderId))
+        return iter(self.children(folderId, "item"))
+
+    def listFile(self, itemId, limit=None, **kwargs):
+        self.calls.append(("listFile", itemId))
+        return iter(self.children(itemId, "file")[:limit])
+
+    def createFolder(self, parentId, name, **kwargs):
+        self.calls.append(("createFolder", name))
+        try:
+            path = self.path_of(parentId) + "/" + name
+        except StopIteration:
+            raise girder_client.HttpError(400, "", "", "POST")
+        if path not in self.resources:
+            self.add(path, "folder")
+        return {"_id": self.resources[path][0]}
+
+    def addMetadataToFolder(self, folderId, metadata):
+        self.calls.append(("addMetadataToFolder", folderId, dict(metadata)))
+        self.metadata.setdefault(folderId, {}).update(metadata)
+
+    def getFolder(self, folderId):
+        self.calls.append(("getFolder", folderId))
+        return {"meta": dict(self.metadata.get(folderId, {}))}
+
+    def count(self, name) -> int:
+        return sum(call[0] == name for call in self.calls)
+# ------------------------------------------------------------------
+
+
+# Function to isolate the class-level state of the client in a test
+def patch_class_state(test: unittest.TestCase, cls, **values) -> None:
+    """Replaces the class attributes of `cls` with `values` until the end of `test`"""
+    for name, value in values.items():
+        patcher = mock.patch.object(cls, name, value)
+        patcher.start()
+        test.addCleanup(patcher.stop)
+# ------------------------------------------------------------------
+
+# Function to replace Girder in a test
+def patch_girder(test: unittest.TestCase, *paths) -> FakeGirder:
+    """Connects VipCI to a new FakeGirder with `paths` until the end of `test`. Returns the FakeGirder."""
+    girder = FakeGirder(*paths)
+    patch_class_state(test, VipCI, _VERBOSE=False, _GIRDER_IDS={}, _GIRDER_PATHS={})
+    patcher = mock.patch.object(VipCI, "_girder_client", girder, create=True)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+    return girder
+# ------------------------------------------------------------------
+
+
+class Test_PipelineCache(unittest.TestCase):
+
+    def setUp(self) -> None:
+        patch_class_state(self, VipLauncher, 
+            _VERBOSE=False, _AVAILABLE_PIPELINES=[], _PIPELINE_DEFS={}, _PIPELINE_FIELDS={}
+        )
+        patcher = mock.patch.object(vip, "pipeline_def", return_value=PIPELINE_DEF)
+        self.pipeline_def = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_definition_is_requested_once(self):
+        self.assertEqual(VipLauncher._get_pipeline_def("Pipeline/1"), PIPELINE_DEF)
+        self.assertEqual(VipLauncher._get_pipeline_def("Pipeline/1"), PIPELINE_DEF)
+        self.pipeline_def.assert_called_once_with("Pipeline/1")
+        # Another pipeline is a cache miss
+        VipLauncher._get_pipeline_def("Pipeline/2")
+        self.assertEqual(self.pipeline_def.call_count, 2)
+
+    def test_fields(self):
+        required, known = VipLauncher._get_pipeline_fields("Pipeline/1")
+        self.assertEqual(required, {"input"})
+        self.assertEqual(known, {"input", "n", "m"})
+        # Fields & definition come from the cache
+        self.assertIs(VipLauncher._get_pipeline_fields("Pipeline/1")[1], known)
+        VipLauncher._get_pipeline_def("Pipeline/1")
+        self.pipeline_def.assert_called_once()
+
+    def test_init_clears_caches(self):
+        VipLauncher._get_pipeline_fields("Pipeline/1")
+        with mock.patch.object(vip, "setApiKey", return_value=True), \
+            mock.patch.object(vip, "list_pipeline", return_value=[]):
+            VipLauncher.init(api_key="secret", verbose=False)
+        self.assertFalse(VipLauncher._PIPELINE_DEFS)
+        self.assertFalse(VipLauncher._PIPELINE_FIELDS)
+        # The definition is requested again
+        VipLauncher._get_pipeline_def("Pipeline/1")
+        self.assertEqual(self.pipeline_def.call_count, 2)
+    # ------------------------------------------------
+# ------------------------------------------------------------------
+
+
+
+class Test_MapParallel(unittest.TestCase):
+
+    def test_order(self):
+        self.assertEqual(
+            VipLauncher._map_parallel(lambda x: x * x, range(50), vip_sessions=False),
+            [x * x for x in range(50)]
+        )
+
+    def test_error(self):
+        def func(x):
+            if x == 3: raise ValueError(x)
+            return x
+        with self.assertRaises(ValueError):
+            VipLauncher._map_parallel(func, range(10), vip_sessions=False)
+
+    def test_single_element(self):
+        main_thread = threading.current_thread()
+        self.assertEqual(VipLauncher._map_parallel(lambda x: threading.current_thread(), [0]), [main_thread])
+        self.assertEqual(VipLauncher._map_parallel(lambda x: x, []), [])
+    # ------------------------------------------------
+# ------------------------------------------------------------------
+
+
+class Test_Launch(unittest.TestCase):
+
+    def setUp(self) -> None:
+        patch_class_state(self, VipLauncher, _VERBOSE=False)
+        for method, value in [("_check_pipeline_id", True), ("_mkdirs", False), ("_check_input_settings", None)]:
+            patcher = mock.patch.object(VipLauncher, method, return_value=value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch.object(VipLauncher, "_get_exec_infos", return_value={"status": "Running"})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.session = VipLauncher(output_dir="/vip/Home/out", verbose=False)
+        self.session._save = mock.Mock()
+
+    def launch(self, init_exec, nb_runs: int) -> mock.Mock:
+        """Launches `nb_runs` executions with `init_exec`. Returns the mock of `_thread_pool()`"""
+        with mock.patch.object(VipLauncher, "_init_exec", side_effect=init_exec), \
+            mock.patch.object(VipLauncher, "_thread_pool", wraps=VipLauncher._thread_pool) as pool:
+            self.session.launch_pipeline(
+                pipeline_id="Pipeline/1", input_settings={"input": "file.txt"}, nb_runs=nb_runs
+            )
+        return pool
+
+    def test_single_run(self):
+        pool = self.launch(lambda: "w1", nb_runs=1)
+        pool.assert_not_called()
+        self.assertEqual(list(self.session.workflows), ["w1"])
+
+    def test_parallel_runs(self):
+        ids = itertools.count()
+        pool = self.launch(lambda: f"w{next(ids)}", nb_runs=5)
+        pool.assert_called_once()
+        self.assertEqual(sorted(self.session.workflows), [f"w{i}" for i in range(5)])
+
+    def test_partial_failure(self):
+        ids = itertools.count()
+        def init_exec():
+            i = next(ids)
+            if i == 2: raise RuntimeError("error")
+            return f"w{i}"
+        with self.assertRaises(RuntimeError):
+            self.launch(init_exec, nb_runs=4)
+        # Started executions are registered & saved
+        self.assertEqual(sorted(self.session.workflows), ["w0", "w1", "w3"])
+        self.session._save.assert_called_once()
+
+    def test_first_failure(self):
+        init_exec = mock.Mock(side_effect=RuntimeError("error"))
+        with self.assertRaises(RuntimeError):
+            self.launch(init_exec, nb_runs=4)
+        # Other executions are not launched
+        init_exec.assert_called_once()
+        self.assertFalse(self.session.workflows)
+        self.session._save.assert_called_once()
+
+    def test_sessions_are_closed(self):
+        sessions = []
+        def init_thread():
+            sessions.append(mock.Mock())
+            return sessions[-1]
+        with mock.patch.object(vip, "init_thread", side_effect=init_thread):
+            VipLauncher._map_parallel(lambda x: x, range(20))
+        self.assertTrue(sessions)
+        for session in sessions:
+            session.close.assert_called_once()
+
+    def test_without_vip_sessions(self):
+        with mock.patch.object(vip, "init_thread") as init_thread:
+            VipLauncher._map_parallel(lambda x: x, range(20), vip_sessions=False)
+        init_thread.assert_not_called()
+    # ------------------------------------------------
+# ------------------------------------------------------------------
+
+
+class Test_VipContent(unittest.TestCase):
+
+    def response(self, status_code=200, content=b"", json=None) -> mock.Mock:
+        rq = mock.Mock(status_code=status_code, content=content)
+        rq.headers = {"content-type": "application/json"} if json is not None else {}
+        rq.json.return_value = json
+        return rq
+
+    def test_upload_content(self):
+        session = mock.Mock()
+        session.put.return_value = self.response()
+        with mock.patch.object(vip, "get_session", return_value=session):
+            self.assertTrue(vip.upload_content(b'{"a": 1}', "/vip/Home/file.json"))
+        self.assertEqual(session.put.call_args[1]["data"], b'{"a": 1}')
+        self.assertTrue(session.put.call_args[0][0].endswith("/vip/Home/file.json"))
+
+    def test_upload_content_error(self):
+        session = mock.Mock()
+        session.put.return_value = self.response(json={"errorCode": 1, "errorMessage": "error"})
+        with mock.patch.object(vip, "get_session", return_value=session):
+            self.assertFalse(vip.upload_content(b"", "/vip/Home/file.json"))
+
+    def test_download_content(self):
+        session = mock.Mock()
+        session.get.return_value = self.response(content=b"data")
+        with mock.patch.object(vip, "get_session", return_value=session):
+            self.assertEqual(vip.download_content("/vip/Home/file.json"), b"data")
+        session.get.return_value = self.response(status_code=404)
+        with mock.patch.object(vip, "get_session", return_value=session):
+            self.assertIsNone(vip.download_content("/vip/Home/file.json"))
+
+    def test_save_and_load_session(self):
+        files = {}
+        session = VipLauncher(output_dir="/vip/Home/out", verbose=False)
+        with mock.patch.object(VipLauncher, "_upload_content", side_effect=lambda content, path: files.update({path: content})), \
+            mock.patch.object(VipLauncher, "_download_content", side_effect=files.get), \
+            mock.patch.object(VipLauncher, "_mkdirs", return_value=True), \
+            mock.patch.object(VipLauncher, "_exists", side_effect=lambda path, location: path in files):
+            self.assertIsNone(session._load_session())
+            session._save_session({"session_name": "test", "workflows": {}})
+            self.assertEqual(list(files), [PurePosixPath("/vip/Home/out") / VipLauncher._SAVE_FILE])
+            self.assertEqual(session._load_session(), {"session_name": "test", "workflows": {}})
+    # ------------------------------------------------
+# ------------------------------------------------------------------
+
+
+class Test_InputChecks(unittest.TestCase):
+
+    INPUT_FILE = "/vip/Home/inputs/file.txt"
+
+    def setUp(self) -> None:
+        patch_class_state(self, VipLauncher, 
+            _VERBOSE=False, _AVAILABLE_PIPELINES=["Pipeline/1"], _PIPELINE_DEFS={"Pipeline/1": PIPELINE_DEF}, 
+            _PIPELINE_FIELDS={}
+        )
+        # Files on VIP
+        self.files = {self.INPUT_FILE}
+        patcher = mock.patch.object(
+            VipLauncher, "_exists", side_effect=lambda path, location="vip": str(path) in self.files
+        )
+        self.exists = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.session = VipLauncher(
+            output_dir="/vip/Home/outputs", pipeline_id="Pipeline/1", verbose=False,
+            input_settings={"input": self.INPUT_FILE, "m": "2"}
+        )
+
+    def test_files_are_checked_every_time(self):
+        self.assertTrue(self.session._check_input_settings(location="vip"))
+        self.assertTrue(self.session._check_input_settings(location="vip"))
+        checked = [str(call[1]["path"]) for call in self.exists.call_args_list if "path" in call[1]]
+        self.assertEqual(checked.count(self.INPUT_FILE), 2)
+        # The input file is removed from VIP
+        self.files.clear()
+        with self.assertRaises(FileNotFoundError):
+            self.session._check_input_settings(location="vip")
+
+    def test_input_errors(self):
+        with self.assertRaises(TypeError):
+            self.session._check_input_settings({"m": "2"}, location="vip")
+        with self.assertRaises(ValueError):
+            self.session._check_input_settings({"input": self.INPUT_FILE, "m": ""}, location="vip")
+    # ------------------------------------------------
+# ------------------------------------------------------------------
+
+
+
+class Test_GirderInputs(unittest.TestCase):
+
+    INPUT_DIR = "/collection/c/in"
+
+    def setUp(self) -> None:
+        self.girder = patch_girder(self, 
+            ("/collection/c", "collection"),
+            (self.INPUT_DIR, "folder"),
+            (self.INPUT_DIR + "/a", "item"),
+            (self.INPUT_DIR + "/a/a.txt", "file"),
+        )
+        self.session = VipCI(verbose=False)
+
+    def test_folder_is_listed_again(self):
+        parsed = self.session._parse_input_settings({"input": self.INPUT_DIR, "n": "3"})
+        self.assertEqual(parsed, {"input": [PurePosixPath(self.INPUT_DIR + "/a/a.txt")], "n": "3"})
+        # A new item is added to the folder on Girder
+        self.girder.add(self.INPUT_DIR + "/b", "item")
+        self.girder.add(self.INPUT_DIR + "/b/b.txt", "file")
+        parsed = self.session._parse_input_settings({"input": self.INPUT_DIR, "n": "3"})
+        self.assertEqual(len(parsed["input"]), 2)
+
+    def test_types_are_kept(self):
+        self.assertIsInstance(self.session._parse_input_settings({"n": "3"})["n"], str)
+        self.assertIsInstance(self.session._parse_input_settings({"n": PurePosixPath("3")})["n"], PurePosixPath)
+    # ------------------------------------------------
+# ------------------------------------------------------------------
+
+
+
+class Test_GirderCache(unittest.TestCase):
+
+    OUTPUT_DIR = "/collection/c/out"
+    INPUT_FILE = "/collection/c/in/a/a.txt"
+
+    def setUp(self) -> None:
+        self.girder = patch_girder(self, 
+            ("/collection/c", "collection"),
+            ("/collection/c/in", "folder"),
+            ("/collection/c/in/a", "item"),
+            (self.INPUT_FILE, "file"),
+            (self.OUTPUT_DIR, "folder"),
+        )
+        patch_class_state(self, VipLauncher, 
+            _AVAILABLE_PIPELINES=["Pipeline/1"], _PIPELINE_DEFS={"Pipeline/1": PIPELINE_DEF}, _PIPELINE_FIELDS={}
+        )
+
+    def test_exists(self):
+        self.assertTrue(VipCI._exists("/collection/c/in", location="girder"))
+        self.assertFalse(VipCI._exists("/collection/c/missing", location="girder"))
+        # The resource found by `_exists()` is not looked up again
+        VipCI._girder_path_to_id("/collection/c/in")
+        self.assertEqual(self.girder.count("resourceLookup"), 0)
+        self.assertTrue(VipCI._exists("/collection/c/in", location="girder"))
+        self.assertEqual(self.girder.count("get"), 2)
+
+    def test_paths_to_ids(self):
+        paths = ["/collection/c/in", "/collection/c/in/a", "/collection/c/in"]
+        ids = VipCI._girder_paths_to_ids(paths)
+        self.assertEqual(ids, [self.girder.resources[path] for path in paths])
+        # One lookup per distinct path
+        self.assertEqual(self.girder.count("resourceLookup"), 2)
+        # Cache hit
+        VipCI._girder_paths_to_ids(paths)
+        self.assertEqual(self.girder.count("resourceLookup"), 2)
+
+    def test_mkdirs(self):
+        # Short walk: the ancestors are checked up to the output directory
+        self.assertEqual(VipCI._mkdirs(self.OUTPUT_DIR + "/a/b", location="girder"), "a/b")
+        self.assertEqual(self.girder.count("get"), 3)
+        self.assertIn(self.OUTPUT_DIR + "/a/b", self.girder.resources)
+        # Long walk: the last ancestors are checked in parallel
+        self.girder.calls.clear()
+        with mock.patch.object(VipCI, "_map_parallel", wraps=VipCI._map_parallel) as map_parallel:
+            self.assertEqual(VipCI._mkdirs(self.OUTPUT_DIR + "/c/d/e/f/g", location="girder"), "c/d/e/f/g")
+        self.assertEqual(
+            map_parallel.call_args_list[0][0][1], [PurePosixPath(self.OUTPUT_DIR + "/c"), PurePosixPath(self.OUTPUT_DIR)]
+        )
+        # The output directory is cached since the first call
+        self.assertEqual(self.girder.count("get"), 5)
+        self.assertIn(self.OUTPUT_DIR + "/c/d/e/f/g", self.girder.resources)
+        # Existing path
+        self.assertEqual(VipCI._mkdirs(self.OUTPUT_DIR + "/c/d", location="girder"), "")
+
+    def test_outdated_id(self):
+        VipCI._girder_path_to_id(self.OUTPUT_DIR)
+        # The output directory is removed and created again on Girder
+        self.girder.remove(self.OUTPUT_DIR)
+        new_id = self.girder.add(self.OUTPUT_DIR, "folder")
+        # The cached ID is rejected, then looked up again
+        VipCI._create_dir(self.OUTPUT_DIR + "/new", location="girder")
+        self.assertEqual(VipCI._girder_path_to_id(self.OUTPUT_DIR), (new_id, "folder"))
+        self.assertIn(self.OUTPUT_DIR + "/new", self.girder.resources)
+        # A missing resource raises the lookup error
+        self.girder.remove(self.OUTPUT_DIR)
+        self.girder.add("/collection/c/other", "folder")
+        with self.assertRaises(girder_client.HttpError):
+            VipCI._create_dir(self.OUTPUT_DIR + "/new2", location="girder")
+
+    def init(self) -> None:
+        """Calls VipCI.init() with a new mock of the Girder client"""
+        with mock.patch.object(vip, "setApiKey", return_value=True), \
+            mock.patch.object(vip, "list_pipeline", return_value=[]), \
+            mock.patch.object(girder_client, "GirderClient", side_effect=lambda **kwargs: mock.MagicMock()):
+            VipCI.init(vip_key="secret", girder_key="secret", verbose=False)
+
+    def test_init_clears_caches(self):
+        patch_class_state(self, VipCI, _AVAILABLE_PIPELINES=[], _GIRDER_SESSION=None)
+        VipCI._girder_path_to_id("/collection/c/in")
+        self.init()
+        self.assertFalse(VipCI._GIRDER_IDS)
+        self.assertFalse(VipCI._GIRDER_PATHS)
+
+    def test_init_closes_previous_session(self):
+        patch_class_state(self, VipCI, _AVAILABLE_PIPELINES=[], _GIRDER_SESSION=None)
+        self.init()
+        session = VipCI._girder_client.session.return_value
+        session.__enter__.assert_called_once()
+        session.__exit__.assert_not_called()
+        # The session of the first client is closed when a new client is instantiated
+        self.init()
+        session.__exit__.assert_called_once()
+        VipCI._girder_client.session.return_value.__exit__.assert_not_called()
+
+    def test_init_exec(self):
+        session = VipCI(output_dir=self.OUTPUT_DIR, session_name="test", verbose=False)
+        with mock.patch.object(VipCI, "_get_input_settings", return_value={}), \
+            mock.patch.object(vip, "init_exec", return_value="wid") as init_exec:
+            self.assertEqual(session._init_exec(), "wid")
+        # The result folder is created & cached
+        res_path = session._workflows["wid"]["output_path"]
+        res_id = self.girder.resources[res_path][0]
+        self.assertEqual(init_exec.call_args[1]["resultsLocation"], VipCI._vip_girder_id(res_id))
+        self.assertEqual(VipCI._GIRDER_IDS[res_path], (res_id, "folder"))
+
+    def test_bulk_add_metadata(self):
+        VipCI._bulk_add_metadata([("id1", {"a": 1}), ("id2", {"b": 2})])
+        self.assertEqual(self.girder.metadata, {"id1": {"a": 1}, "id2": {"b": 2}})
+        VipCI._bulk_add_metadata([])
+        self.assertEqual(self.girder.count("addMetadataToFolder"), 2)
+
+    def test_save_session_delta(self):
+        session = VipCI(output_dir=self.OUTPUT_DIR, session_name="test", verbose=False)
+        res_id = self.girder.add(self.OUTPUT_DIR + "/res", "folder")
+        session._workflows = {"wid": {
+            "output_path": self.OUTPUT_DIR + "/res", "status": "Running", "start": "2024/01/01 00:00:00"
+        }}
+        out_id = self.girder.resources[self.OUTPUT_DIR][0]
+        # First save: every key is sent
+        session._save_session({"session_name": "test", "workflows": {"wid": "Running"}}, location="girder")
+        self.assertEqual(self.girder.metadata[out_id]["workflows"], {"wid": "Running"})
+        self.assertEqual(self.girder.metadata[res_id]["workflow_status"], "Running")
+        self.girder.calls.clear()
+        # Same data: nothing is sent
+        session._save_session({"session_name": "test", "workflows": {"wid": "Running"}}, location="girder")
+        self.assertEqual(self.girder.count("addMetadataToFolder"), 0)
+        # Status update: only the changed keys are sent
+        session._workflows["wid"]["status"] = "Finished"
+        session._save_session({"session_name": "test", "workflows": {"wid": "Finished"}}, location="girder")
+        sent = {call[1]: call[2] for call in self.girder.calls if call[0] == "addMetadataToFolder"}
+        self.assertEqual(sent, {
+            out_id: {"workflows": {"wid": "Finished"}},
+            res_id: {"workflow_status": "Finished"}
+        })
+
+    def test_deleted_input_file(self):
+        session = VipCI(
+            pipeline_id="Pipeline/1", input_settings={"input": self.INPUT_FILE, "m": "2"}, verbose=False
+        )
+        self.assertTrue(session._check_input_settings(location="girder"))
+        self.assertIn(self.INPUT_FILE, VipCI._GIRDER_IDS)
+        # The input file is removed from Girder
+        self.girder.remove(self.INPUT_FILE)
+        with self.assertRaises(FileNotFoundError):
+            session._check_input_settings(location="girder")
+    # ------------------------------------------------
+# ------------------------------------------------------------------
+
+
+
+class Test_Mkdirs(unittest.TestCase):
+
+    def test_missing_parents(self):
+        for cls in (VipLauncher, VipClient):
+            created = []
+            with mock.patch.object(cls, "_exists", side_effect=lambda path, location: len(path.parts) <= 3), \
+                mock.patch.object(cls, "_create_dir", side_effect=lambda path, location: created.append(str(path))):
+                self.assertEqual(cls._mkdirs(PurePosixPath("/vip/Home/a/b/c"), location="vip"), "a/b/c")
+            self.assertEqual(created, ["/vip/Home/a", "/vip/Home/a/b", "/vip/Home/a/b/c"])
+
+    def test_upload_new_dir(self):
+        patch_class_state(self, VipLoader, _VERBOSE=False)
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        local_dir = Path(tmp_dir.name)
+        (local_dir / "sub" / "subsub").mkdir(parents=True)
+        for file in ["a.txt", "sub/b.txt", "sub/subsub/c.txt"]:
+            (local_dir / file).touch()
+        checked, created, uploaded = [], [], []
+        def exists(path, location):
+            checked.append(location)
+            return location == "local"
+        def upload_file(local_path, vip_path):
+            uploaded.append(str(vip_path))
+            return True
+        with mock.patch.object(VipLoader, "_exists", side_effect=exists), \
+            mock.patch.object(VipLoader, "_mkdirs", return_value="new") as mkdirs, \
+            mock.patch.object(VipLoader, "_create_dir", side_effect=lambda path, location: created.append(str(path))), \
+            mock.patch.object(VipLoader, "_upload_file", side_effect=upload_file):
+            self.assertEqual(VipLoader._upload_dir(local_dir, PurePosixPath("/vip/Home/new")), [])
+        # Sub-directories of the new directory are created without any check on VIP
+        mkdirs.assert_called_once()
+        self.assertNotIn("vip", checked)
+        self.assertEqual(created, ["/vip/Home/new/sub", "/vip/Home/new/sub/subsub"])
+        self.assertEqual(sorted(uploaded), 
+            ["/vip/Home/new/a.txt", "/vip/Home/new/sub/b.txt", "/vip/Home/new/sub/subsub/c.txt"]
+        )
+    # ------------------------------------------------
+# ------------------------------------------------------------------
+
+
+class Test_DeleteAndCheck(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Simulated clock
+        self.now = 0
+        self.waits = []
+        def sleep(seconds):
+            self.waits.append(seconds)
+            self.now += seconds
+        for target, side_effect in [("time.sleep", sleep), ("time.time", lambda: self.now)]:
+            patcher = mock.patch(target, side_effect=side_effect)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def delete(self, cls, nb_checks: int, timeout: float) -> bool:
+        """Deletes a path which still exists for the `nb_checks` first checks"""
+        checks = itertools.count()
+        with mock.patch.object(cls, "_delete_path"), \
+            mock.patch.object(cls, "_exists", side_effect=lambda path, location: next(checks) < nb_checks):
+            return cls._delete_and_check("/vip/Home/file.json", location="vip", timeout=timeout)
+
+    def test_backoff(self):
+        for cls in (VipLauncher, VipClient):
+            self.waits.clear()
+            self.assertTrue(self.delete(cls, nb_checks=8, timeout=300))
+            self.assertEqual(self.waits, [0.5, 1, 2, 4, 8, 16, 16, 16])
+
+    def test_timeout(self):
+        for cls in (VipLauncher, VipClient):
+            self.waits.clear()
+            self.now = 0
+            self.assertFalse(self.delete(cls, nb_checks=100, timeout=10))
+            # The last wait ends at the timeout
+            self.assertEqual(self.waits, [0.5, 1, 2, 4, 2.5])
+    # ------------------------------------------------
+# ------------------------------------------------------------------
+
+
+class Test_Monitor(unittest.TestCase):
+
+    def setUp(self) -> None:
+        patch_class_state(self, VipLauncher, _VERBOSE=False, _FIRST_REFRESH_TIME=2, _REFRESH_BACKOFF=1.5)
+        self.session = VipLauncher(verbose=False)
+        self.session._save = mock.Mock()
+        # Waiting times
+        self.waits = []
+        patcher = mock.patch("time.sleep", side_effect=self.waits.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_monitor(self, statuses: dict, refresh_time=30) -> dict:
+        """
+        Monitors workflows whose successive status are given by `statuses` (workflow ID -> list).
+        Returns the number of status requests per workflow.
+        """
+        calls = {wid: 0 for wid in statuses}
+        def get_exec_infos(wid):
+            status = statuses[wid][min(calls[wid], len(statuses[wid]) - 1)]
+            calls[wid] += 1
+            return {"status": status, "start": "", "outputs": []}
+        self.session._workflows = {wid: {"status": "Initializing"} for wid in statuses}
+        with mock.patch.object(VipLauncher, "_get_exec_infos", side_effect=get_exec_infos):
+            self.session.monitor_workflows(refresh_time=refresh_time)
+        return calls
+
+    def test_active_status(self):
+        calls = self.run_monitor({"w1": ["Initializing", "Ready", "Running", "Finished"]})
+        self.assertEqual(calls["w1"], 4)
+        self.assertEqual(self.session.workflows["w1"]["status"], "Finished")
+
+    def test_unknown_status_ends_monitoring(self):
+        calls = self.run_monitor({"w1": ["Running", "SomeNewStatus"]})
+        self.assertEqual(calls["w1"], 2)
+        self.assertEqual(self.session._still_running(), 0)
+
+    def test_only_active_workflows_are_polled(self):
+        calls = self.run_monitor({"w1": ["Running", "Finished"], "w2": ["Running"] * 4 + ["Failed"]})
+        self.assertEqual(calls, {"w1": 2, "w2": 5})
+
+    def test_backoff(self):
+        self.run_monitor({"w1": ["Running"] * 6 + ["Finished"]}, refresh_time=5)
+        # Waiting times are shortened by the (small) duration of each update
+        waits = [round(wait, 1) for wait in self.waits]
+        self.assertEqual(waits[:4], [2, 3, 4.5, 5])
+        self.assertEqual(set(waits[3:]), {5})
+
+    def test_backoff_reset(self):
+        self.run_monitor({"w1": ["Running"] * 3 + ["Finished"], "w2": ["Running"] * 6 + ["Failed"]}, refresh_time=5)
+        # Waiting times restart from the first one when `w1` is over
+        waits = [round(wait, 1) for wait in self.waits]
+        self.assertEqual(waits, [2, 3, 4.5, 2, 3, 4.5])
+
+    def test_single_workflow_without_threads(self):
+        with mock.patch.object(vip, "init_thread") as init_thread:
+            self.run_monitor({"w1": ["Running", "Finished"]})
+        init_thread.assert_not_called()
+
+    def test_same_pool_for_all_updates(self):
+        with mock.patch.object(VipLauncher, "_thread_pool", wraps=VipLauncher._thread_pool) as pool:
+            calls = self.run_monitor({"w1": ["Running"] * 3 + ["Finished"], "w2": ["Running"] * 3 + ["Failed"]})
+        self.assertEqual(calls, {"w1": 4, "w2": 4})
+        # One pool for the first update, one for the monitoring loop
+        self.assertEqual(pool.call_count, 2)
+    # ------------------------------------------------
+# ------------------------------------------------------------------
+
+
+if __name__=="__main__":
+    unittest.main()